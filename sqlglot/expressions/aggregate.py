@@ -6,89 +6,103 @@ from sqlglot.expressions.core import Expression, Func, AggFunc, Binary
 
 
 class AIAgg(Expression, AggFunc):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True}
     _sql_names = ["AI_AGG"]
 
 
 class AISummarizeAgg(Expression, AggFunc):
+    __slots__ = ()
     _sql_names = ["AI_SUMMARIZE_AGG"]
 
 
 class AnyValue(Expression, AggFunc):
-    pass
+    __slots__ = ()
 
 
 class ApproximateSimilarity(Expression, AggFunc):
+    __slots__ = ()
     _sql_names = ["APPROXIMATE_SIMILARITY", "APPROXIMATE_JACCARD_INDEX"]
 
 
 class ApproxPercentileAccumulate(Expression, AggFunc):
-    pass
+    __slots__ = ()
 
 
 class ApproxPercentileCombine(Expression, AggFunc):
-    pass
+    __slots__ = ()
 
 
 class ApproxPercentileEstimate(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "percentile": True}
 
 
 class ApproxQuantiles(Expression, AggFunc):
+    __slots__ = ()
     arg_types = {"this": True, "expression": False}
 
 
 class ApproxTopK(Expression, AggFunc):
+    __slots__ = ()
     arg_types = {"this": True, "expression": False, "counters": False}
 
 
 class ApproxTopKAccumulate(Expression, AggFunc):
+    __slots__ = ()
     arg_types = {"this": True, "expression": False}
 
 
 class ApproxTopKCombine(Expression, AggFunc):
+    __slots__ = ()
     arg_types = {"this": True, "expression": False}
 
 
 class ApproxTopKEstimate(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": False}
 
 
 class ApproxTopSum(Expression, AggFunc):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True, "count": True}
 
 
 class ArgMax(Expression, AggFunc):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True, "count": False}
     _sql_names = ["ARG_MAX", "ARGMAX", "MAX_BY"]
 
 
 class ArgMin(Expression, AggFunc):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True, "count": False}
     _sql_names = ["ARG_MIN", "ARGMIN", "MIN_BY"]
 
 
 class ArrayAgg(Expression, AggFunc):
+    __slots__ = ()
     arg_types = {"this": True, "nulls_excluded": False}
 
 
 class ArrayConcatAgg(Expression, AggFunc):
-    pass
+    __slots__ = ()
 
 
 class ArrayUnionAgg(Expression, AggFunc):
-    pass
+    __slots__ = ()
 
 
 class ArrayUniqueAgg(Expression, AggFunc):
-    pass
+    __slots__ = ()
 
 
 class Avg(Expression, AggFunc):
-    pass
+    __slots__ = ()
 
 
 class Corr(Expression, AggFunc, Binary):
+    __slots__ = ()
     # Correlation divides by variance(column). If a column has 0 variance, the denominator
     # is 0 - some dialects return NaN (DuckDB) while others return NULL (Snowflake).
     # `null_on_zero_variance` is set to True at parse time for dialects that return NULL.
@@ -96,126 +110,150 @@ class Corr(Expression, AggFunc, Binary):
 
 
 class Count(Expression, AggFunc):
+    __slots__ = ()
     arg_types = {"this": False, "expressions": False, "big_int": False}
     is_var_len_args = True
 
 
 class CountIf(Expression, AggFunc):
+    __slots__ = ()
     _sql_names = ["COUNT_IF", "COUNTIF"]
 
 
 class CovarPop(Expression, AggFunc):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True}
 
 
 class CovarSamp(Expression, AggFunc):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True}
 
 
 class CumeDist(Expression, AggFunc):
+    __slots__ = ()
     arg_types = {"expressions": False}
     is_var_len_args = True
 
 
 class DenseRank(Expression, AggFunc):
+    __slots__ = ()
     arg_types = {"expressions": False}
     is_var_len_args = True
 
 
 class First(Expression, AggFunc):
+    __slots__ = ()
     arg_types = {"this": True, "expression": False}
 
 
 class FirstValue(Expression, AggFunc):
-    pass
+    __slots__ = ()
 
 
 class GroupConcat(Expression, AggFunc):
+    __slots__ = ()
     arg_types = {"this": True, "separator": False, "on_overflow": False}
 
 
 class Grouping(Expression, AggFunc):
+    __slots__ = ()
     arg_types = {"expressions": True}
     is_var_len_args = True
 
 
 class GroupingId(Expression, AggFunc):
+    __slots__ = ()
     arg_types = {"expressions": False}
     is_var_len_args = True
 
 
 class Kurtosis(Expression, AggFunc):
-    pass
+    __slots__ = ()
 
 
 class Lag(Expression, AggFunc):
+    __slots__ = ()
     arg_types = {"this": True, "offset": False, "default": False}
 
 
 class Last(Expression, AggFunc):
+    __slots__ = ()
     arg_types = {"this": True, "expression": False}
 
 
 class LastValue(Expression, AggFunc):
-    pass
+    __slots__ = ()
 
 
 class Lead(Expression, AggFunc):
+    __slots__ = ()
     arg_types = {"this": True, "offset": False, "default": False}
 
 
 class LogicalAnd(Expression, AggFunc):
+    __slots__ = ()
     _sql_names = ["LOGICAL_AND", "BOOL_AND", "BOOLAND_AGG"]
 
 
 class LogicalOr(Expression, AggFunc):
+    __slots__ = ()
     _sql_names = ["LOGICAL_OR", "BOOL_OR", "BOOLOR_AGG"]
 
 
 class Max(Expression, AggFunc):
+    __slots__ = ()
     arg_types = {"this": True, "expressions": False}
     is_var_len_args = True
 
 
 class Median(Expression, AggFunc):
-    pass
+    __slots__ = ()
 
 
 class Min(Expression, AggFunc):
+    __slots__ = ()
     arg_types = {"this": True, "expressions": False}
     is_var_len_args = True
 
 
 class Minhash(Expression, AggFunc):
+    __slots__ = ()
     arg_types = {"this": True, "expressions": True}
     is_var_len_args = True
 
 
 class MinhashCombine(Expression, AggFunc):
-    pass
+    __slots__ = ()
 
 
 class Mode(Expression, AggFunc):
+    __slots__ = ()
     arg_types = {"this": False, "deterministic": False}
 
 
 class Ntile(Expression, AggFunc):
+    __slots__ = ()
     arg_types = {"this": False}
 
 
 class NthValue(Expression, AggFunc):
+    __slots__ = ()
     arg_types = {"this": True, "offset": True, "from_first": False}
 
 
 class ObjectAgg(Expression, AggFunc):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True}
 
 
 class PercentileCont(Expression, AggFunc):
+    __slots__ = ()
     arg_types = {"this": True, "expression": False}
 
 
 class PercentileDisc(Expression, AggFunc):
+    __slots__ = ()
     arg_types = {"this": True, "expression": False}
 
 
@@ -223,15 +261,18 @@ PERCENTILES = (PercentileCont, PercentileDisc)
 
 
 class PercentRank(Expression, AggFunc):
+    __slots__ = ()
     arg_types = {"expressions": False}
     is_var_len_args = True
 
 
 class Quantile(Expression, AggFunc):
+    __slots__ = ()
     arg_types = {"this": True, "quantile": True}
 
 
 class ApproxQuantile(Quantile):
+    __slots__ = ()
     arg_types = {
         "this": True,
         "quantile": True,
@@ -242,81 +283,97 @@ class ApproxQuantile(Quantile):
 
 
 class Rank(Expression, AggFunc):
+    __slots__ = ()
     arg_types = {"expressions": False}
     is_var_len_args = True
 
 
 class RegrAvgx(Expression, AggFunc):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True}
 
 
 class RegrAvgy(Expression, AggFunc):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True}
 
 
 class RegrCount(Expression, AggFunc):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True}
 
 
 class RegrIntercept(Expression, AggFunc):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True}
 
 
 class RegrR2(Expression, AggFunc):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True}
 
 
 class RegrSlope(Expression, AggFunc):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True}
 
 
 class RegrSxx(Expression, AggFunc):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True}
 
 
 class RegrSxy(Expression, AggFunc):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True}
 
 
 class RegrSyy(Expression, AggFunc):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True}
 
 
 class RegrValx(Expression, AggFunc):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True}
 
 
 class RegrValy(Expression, AggFunc):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True}
 
 
 class RowNumber(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": False}
 
 
 class Skewness(Expression, AggFunc):
-    pass
+    __slots__ = ()
 
 
 class Stddev(Expression, AggFunc):
+    __slots__ = ()
     _sql_names = ["STDDEV", "STDEV"]
 
 
 class StddevPop(Expression, AggFunc):
-    pass
+    __slots__ = ()
 
 
 class StddevSamp(Expression, AggFunc):
-    pass
+    __slots__ = ()
 
 
 class Sum(Expression, AggFunc):
-    pass
+    __slots__ = ()
 
 
 class Variance(Expression, AggFunc):
+    __slots__ = ()
     _sql_names = ["VARIANCE", "VARIANCE_SAMP", "VAR_SAMP"]
 
 
 class VariancePop(Expression, AggFunc):
+    __slots__ = ()
     _sql_names = ["VARIANCE_POP", "VAR_POP"]
@@ -18,6 +18,7 @@ from sqlglot.expressions.query import UDTF
 
 
 class Array(Expression, Func):
+    __slots__ = ()
     arg_types = {
         "expressions": False,
         "bracket_notation": False,
@@ -27,70 +28,82 @@ class Array(Expression, Func):
 
 
 class ArrayConstructCompact(Expression, Func):
+    __slots__ = ()
     arg_types = {"expressions": False}
     is_var_len_args = True
 
 
 class List(Expression, Func):
+    __slots__ = ()
     arg_types = {"expressions": False}
     is_var_len_args = True
 
 
 class ToArray(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 # Array manipulation
 
 
 class ArrayAppend(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True, "null_propagation": False}
 
 
 class ArrayCompact(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class ArrayConcat(Expression, Func):
+    __slots__ = ()
     _sql_names = ["ARRAY_CONCAT", "ARRAY_CAT"]
     arg_types = {"this": True, "expressions": False, "null_propagation": False}
     is_var_len_args = True
 
 
 class ArrayFilter(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True}
     _sql_names = ["FILTER", "ARRAY_FILTER"]
 
 
 class ArrayInsert(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "position": True, "expression": True, "offset": False}
 
 
 class ArrayPrepend(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True, "null_propagation": False}
 
 
 class ArrayRemove(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True, "null_propagation": False}
 
 
 class ArrayRemoveAt(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "position": True}
 
 
 class ArrayReverse(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class ArraySlice(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "start": True, "end": False, "step": False, "zero_based": False}
 
 
 class ArraySort(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": False}
 
 
 class SortArray(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "asc": False, "nulls_first": False}
 
 
@@ -98,37 +111,45 @@ class SortArray(Expression, Func):
 
 
 class ArrayAll(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True}
 
 
 class ArrayAny(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True}
 
 
 class ArrayContains(Expression, Binary, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True, "ensure_variant": False, "check_null": False}
     _sql_names = ["ARRAY_CONTAINS", "ARRAY_HAS"]
 
 
 class ArrayContainsAll(Expression, Binary, Func):
+    __slots__ = ()
     _sql_names = ["ARRAY_CONTAINS_ALL", "ARRAY_HAS_ALL"]
 
 
 class ArrayExcept(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True, "is_multiset": False}
 
 
 class ArrayIntersect(Expression, Func):
+    __slots__ = ()
     arg_types = {"expressions": True, "is_multiset": False}
     is_var_len_args = True
     _sql_names = ["ARRAY_INTERSECT", "ARRAY_INTERSECTION"]
 
 
 class ArrayOverlaps(Expression, Binary, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True, "null_safe": False}
 
 
 class ArrayPosition(Expression, Binary, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True, "zero_based": False}
 
 
@@ -136,31 +157,35 @@ class ArrayPosition(Expression, Binary, Func):
 
 
 class ArrayDistinct(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "check_null": False}
 
 
 class ArrayFirst(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": False}
 
 
 class ArrayLast(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class ArrayMax(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class ArrayMin(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class ArraySize(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": False}
     _sql_names = ["ARRAY_SIZE", "ARRAY_LENGTH"]
 
 
 class ArraySum(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": False}
 
 
@@ -168,11 +193,13 @@ class ArraySum(Expression, Func):
 
 
 class ArraysZip(Expression, Func):
+    __slots__ = ()
     arg_types = {"expressions": False}
     is_var_len_args = True
 
 
 class ArrayToString(Expression, Func):
+    __slots__ = ()
     arg_types = {
         "this": True,
         "expression": True,
@@ -184,10 +211,11 @@ class ArrayToString(Expression, Func):
 
 
 class Flatten(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class StringToArray(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": False, "null": False}
     _sql_names = ["STRING_TO_ARRAY", "SPLIT_BY_STRING", "STRTOK_TO_ARRAY"]
 
@@ -196,14 +224,17 @@ class StringToArray(Expression, Func):
 
 
 class Apply(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True}
 
 
 class Reduce(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "initial": True, "merge": True, "finish": False}
 
 
 class Transform(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True}
 
 
@@ -211,48 +242,53 @@ class Transform(Expression, Func):
 
 
 class GenerateSeries(Expression, Func):
+    __slots__ = ()
     arg_types = {"start": True, "end": True, "step": False, "is_end_exclusive": False}
 
 
 class ExplodingGenerateSeries(GenerateSeries):
-    pass
+    __slots__ = ()
 
 
 class Generator(Expression, Func, UDTF):
+    __slots__ = ()
     arg_types = {"rowcount": False, "timelimit": False}
 
 
 class Explode(Expression, Func, UDTF):
+    __slots__ = ()
     arg_types = {"this": True, "expressions": False}
     is_var_len_args = True
 
 
 class Inline(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 @trait
 class ExplodeOuter(Expr):
-    pass
+    __slots__ = ()
 
 
 class _ExplodeOuter(Explode, ExplodeOuter):
+    __slots__ = ()
     _sql_names = ["EXPLODE_OUTER"]
 
 
 class Posexplode(Explode):
-    pass
+    __slots__ = ()
 
 
 class PosexplodeOuter(Posexplode, ExplodeOuter):
-    pass
+    __slots__ = ()
 
 
 class PositionalColumn(Expression):
-    pass
+    __slots__ = ()
 
 
 class Unnest(Expression, Func, UDTF):
+    __slots__ = ()
     arg_types = {
         "expressions": True,
         "alias": False,
@@ -273,6 +309,7 @@ class Unnest(Expression, Func, UDTF):
 
 
 class Map(Expression, Func):
+    __slots__ = ()
     arg_types = {"keys": False, "values": False}
 
     @property
@@ -287,48 +324,54 @@ class Map(Expression, Func):
 
 
 class MapCat(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True}
 
 
 class MapContainsKey(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "key": True}
 
 
 class MapDelete(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expressions": True}
     is_var_len_args = True
 
 
 class MapFromEntries(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class MapInsert(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "key": False, "value": True, "update_flag": False}
 
 
 class MapKeys(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class MapPick(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expressions": True}
     is_var_len_args = True
 
 
 class MapSize(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class StarMap(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class ToMap(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class VarMap(Expression, Func):
+    __slots__ = ()
     arg_types = {"keys": True, "values": True}
     is_var_len_args = True
 
@@ -345,11 +388,13 @@ class VarMap(Expression, Func):
 
 
 class Struct(Expression, Func):
+    __slots__ = ()
     arg_types = {"expressions": False}
     is_var_len_args = True
 
 
 class StructExtract(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True}
 
 
@@ -357,9 +402,11 @@ class StructExtract(Expression, Func):
 
 
 class StDistance(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True, "use_spheroid": False}
 
 
 class StPoint(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True, "null": False}
     _sql_names = ["ST_POINT", "ST_MAKEPOINT"]
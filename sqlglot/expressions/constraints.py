@@ -6,6 +6,7 @@ from sqlglot.expressions.core import Expression, ColumnConstraintKind
 
 
 class IndexConstraintOption(Expression):
+    __slots__ = ()
     arg_types = {
         "key_block_size": False,
         "using": False,
@@ -18,10 +19,12 @@ class IndexConstraintOption(Expression):
 
 
 class Reference(Expression):
+    __slots__ = ()
     arg_types = {"this": True, "expressions": False, "options": False}
 
 
 class ColumnConstraint(Expression):
+    __slots__ = ()
     arg_types = {"this": False, "kind": True}
 
     @property
@@ -30,78 +33,87 @@ class ColumnConstraint(Expression):
 
 
 class AutoIncrementColumnConstraint(Expression, ColumnConstraintKind):
-    pass
+    __slots__ = ()
 
 
 class InvisibleColumnConstraint(Expression, ColumnConstraintKind):
+    __slots__ = ()
     arg_types = {}
 
 
 class ZeroFillColumnConstraint(ColumnConstraint):
+    __slots__ = ()
     arg_types = {}
 
 
 class PeriodForSystemTimeConstraint(Expression, ColumnConstraintKind):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True}
 
 
 class CaseSpecificColumnConstraint(Expression, ColumnConstraintKind):
+    __slots__ = ()
     arg_types = {"not_": True}
 
 
 class CharacterSetColumnConstraint(Expression, ColumnConstraintKind):
-    pass
+    __slots__ = ()
 
 
 class CheckColumnConstraint(Expression, ColumnConstraintKind):
+    __slots__ = ()
     arg_types = {"this": True, "enforced": False}
 
 
 class AssumeColumnConstraint(Expression, ColumnConstraintKind):
-    pass
+    __slots__ = ()
 
 
 class ClusteredColumnConstraint(Expression, ColumnConstraintKind):
-    pass
+    __slots__ = ()
 
 
 class CollateColumnConstraint(Expression, ColumnConstraintKind):
-    pass
+    __slots__ = ()
 
 
 class CommentColumnConstraint(Expression, ColumnConstraintKind):
-    pass
+    __slots__ = ()
 
 
 class CompressColumnConstraint(Expression, ColumnConstraintKind):
+    __slots__ = ()
     arg_types = {"this": False}
 
 
 class DateFormatColumnConstraint(Expression, ColumnConstraintKind):
-    pass
+    __slots__ = ()
 
 
 class DefaultColumnConstraint(Expression, ColumnConstraintKind):
-    pass
+    __slots__ = ()
 
 
 class EncodeColumnConstraint(Expression, ColumnConstraintKind):
-    pass
+    __slots__ = ()
 
 
 class ExcludeColumnConstraint(Expression, ColumnConstraintKind):
-    pass
+    __slots__ = ()
 
 
 class EphemeralColumnConstraint(Expression, ColumnConstraintKind):
+    __slots__ = ()
     arg_types = {"this": False}
 
 
 class WithOperator(Expression):
+    __slots__ = ()
     arg_types = {"this": True, "op": True}
 
 
 class GeneratedAsIdentityColumnConstraint(Expression, ColumnConstraintKind):
+    __slots__ = ()
     # this: True -> ALWAYS, this: False -> BY DEFAULT
     arg_types = {
         "this": False,
@@ -117,10 +129,12 @@ class GeneratedAsIdentityColumnConstraint(Expression, ColumnConstraintKind):
 
 
 class GeneratedAsRowColumnConstraint(Expression, ColumnConstraintKind):
+    __slots__ = ()
     arg_types = {"start": False, "hidden": False}
 
 
 class IndexColumnConstraint(Expression, ColumnConstraintKind):
+    __slots__ = ()
     arg_types = {
         "this": False,
         "expressions": False,
@@ -133,38 +147,43 @@ class IndexColumnConstraint(Expression, ColumnConstraintKind):
 
 
 class InlineLengthColumnConstraint(Expression, ColumnConstraintKind):
-    pass
+    __slots__ = ()
 
 
 class NonClusteredColumnConstraint(Expression, ColumnConstraintKind):
-    pass
+    __slots__ = ()
 
 
 class NotForReplicationColumnConstraint(Expression, ColumnConstraintKind):
+    __slots__ = ()
     arg_types = {}
 
 
 class MaskingPolicyColumnConstraint(Expression, ColumnConstraintKind):
+    __slots__ = ()
     arg_types = {"this": True, "expressions": False}
 
 
 class NotNullColumnConstraint(Expression, ColumnConstraintKind):
+    __slots__ = ()
     arg_types = {"allow_null": False}
 
 
 class OnUpdateColumnConstraint(Expression, ColumnConstraintKind):
-    pass
+    __slots__ = ()
 
 
 class PrimaryKeyColumnConstraint(Expression, ColumnConstraintKind):
+    __slots__ = ()
     arg_types = {"desc": False, "options": False}
 
 
 class TitleColumnConstraint(Expression, ColumnConstraintKind):
-    pass
+    __slots__ = ()
 
 
 class UniqueColumnConstraint(Expression, ColumnConstraintKind):
+    __slots__ = ()
     arg_types = {
         "this": False,
         "index_type": False,
@@ -175,34 +194,40 @@ class UniqueColumnConstraint(Expression, ColumnConstraintKind):
 
 
 class UppercaseColumnConstraint(Expression, ColumnConstraintKind):
+    __slots__ = ()
     arg_types = {}
 
 
 class WatermarkColumnConstraint(Expression):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True}
 
 
 class PathColumnConstraint(Expression, ColumnConstraintKind):
-    pass
+    __slots__ = ()
 
 
 class ProjectionPolicyColumnConstraint(Expression, ColumnConstraintKind):
-    pass
+    __slots__ = ()
 
 
 class ComputedColumnConstraint(Expression, ColumnConstraintKind):
+    __slots__ = ()
     arg_types = {"this": True, "persisted": False, "not_null": False, "data_type": False}
 
 
 class InOutColumnConstraint(Expression, ColumnConstraintKind):
+    __slots__ = ()
     arg_types = {"input_": False, "output": False, "variadic": False}
 
 
 class Constraint(Expression):
+    __slots__ = ()
     arg_types = {"this": True, "expressions": True}
 
 
 class ForeignKey(Expression):
+    __slots__ = ()
     arg_types = {
         "expressions": False,
         "reference": False,
@@ -213,14 +238,17 @@ class ForeignKey(Expression):
 
 
 class ColumnPrefix(Expression):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True}
 
 
 class PrimaryKey(Expression):
+    __slots__ = ()
     arg_types = {"this": False, "expressions": True, "options": False, "include": False}
 
 
 class IndexParameters(Expression):
+    __slots__ = ()
     arg_types = {
         "using": False,
         "include": False,
@@ -234,4 +262,5 @@ class IndexParameters(Expression):
 
 
 class AddConstraint(Expression):
+    __slots__ = ()
     arg_types = {"expressions": True}
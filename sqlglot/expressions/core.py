@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import datetime
+import importlib
 import logging
 import math
 import numbers
@@ -13,13 +14,12 @@ import typing as t
 from collections import deque
 from copy import deepcopy
 from decimal import Decimal
-from functools import reduce
+from functools import lru_cache
 from collections.abc import Iterator, Sequence, Collection, Mapping, MutableMapping
 from sqlglot._typing import E, T
 from sqlglot.errors import ParseError
 from sqlglot.helper import (
     camel_to_snake_case,
-    ensure_list,
     seq_get,
     to_bool,
     trait,
@@ -46,6 +46,7 @@ TABLE_PARTS = ("this", "db", "catalog")
 COLUMN_PARTS = ("this", "table", "db", "catalog")
 POSITION_META_KEYS: tuple[str, ...] = ("line", "col", "start", "end")
 UNITTEST: bool = "unittest" in sys.modules or "pytest" in sys.modules
+_SCALAR_META_TYPES: frozenset[type] = frozenset((bool, int, float, str, type(None)))
 
 
 @trait
@@ -81,11 +82,28 @@ class Expr:
         args: a mapping used for retrieving the arguments of an expression, given their arg keys.
     """
 
+    __slots__ = (
+        "args",
+        "parent",
+        "arg_key",
+        "index",
+        "comments",
+        "_type",
+        "_meta",
+        "_hash",
+        "_struct_hash",
+        "__weakref__",
+    )
+
     key: t.ClassVar[str] = "expression"
+    _key_hash: t.ClassVar[int] = hash("expression")
     arg_types: t.ClassVar[dict[str, bool]] = {"this": True}
     required_args: t.ClassVar[set[str]] = {"this"}
+    _arg_keys: t.ClassVar[tuple[str, ...]] = ("this",)
+    _is_iterable: t.ClassVar[bool] = False
     is_var_len_args: t.ClassVar[bool] = False
     _hash_raw_args: t.ClassVar[bool] = False
+    _commutative: t.ClassVar[bool] = False
     is_subquery: t.ClassVar[bool] = False
     is_cast: t.ClassVar[bool] = False
 
@@ -97,6 +115,7 @@ class Expr:
     _type: DataType | None
     _meta: dict[str, t.Any] | None
     _hash: int | None
+    _struct_hash: int | None
 
     @classmethod
     def __init_subclass__(cls, **kwargs: t.Any) -> None:
@@ -104,7 +123,10 @@ class Expr:
         # When an Expr class is created, its key is automatically set
         # to be the lowercase version of the class' name.
         cls.key = cls.__name__.lower()
+        cls._key_hash = hash(cls.key)
         cls.required_args = {k for k, v in cls.arg_types.items() if v}
+        cls._arg_keys = tuple(cls.arg_types)
+        cls._is_iterable = "expressions" in cls.arg_types
         # This is so that docstrings are not inherited in pdoc
         setattr(cls, "__doc__", getattr(cls, "__doc__", None) or "")
 
@@ -119,6 +141,7 @@ class Expr:
         self._type: DataType | None = None
         self._meta: dict[str, t.Any] | None = None
         self._hash: int | None = None
+        self._struct_hash: int | None = None
 
         if not self.is_primitive:
             for arg_key, value in self.args.items():
@@ -223,6 +246,9 @@ class Expr:
     def _set_parent(self, arg_key: str, value: object, index: int | None = None) -> None:
         raise NotImplementedError
 
+    def _clear_hash(self) -> None:
+        raise NotImplementedError
+
     @property
     def depth(self) -> int:
         raise NotImplementedError
@@ -255,6 +281,9 @@ class Expr:
     ) -> Iterator[Expr]:
         raise NotImplementedError
 
+    def struct_hash(self) -> int:
+        raise NotImplementedError
+
     def dfs(self, prune: t.Callable[[Expr], bool] | None = None) -> Iterator[Expr]:
         raise NotImplementedError
 
@@ -530,39 +559,39 @@ class Expr:
 
 
 class Expression(Expr):
-    __slots__ = (
-        "args",
-        "parent",
-        "arg_key",
-        "index",
-        "comments",
-        "_type",
-        "_meta",
-        "_hash",
-    )
+    __slots__ = ()
 
     def __eq__(self, other: object) -> bool:
-        return self is other or (type(self) is type(other) and hash(self) == hash(other))
+        if self is other:
+            return True
+        if type(self) is not type(other):
+            return False
+
+        self_hash, other_hash = self._hash, t.cast(Expr, other)._hash
+        if self_hash is not None and other_hash is not None:
+            return self_hash == other_hash
+        return hash(self) == hash(other)
 
     def __ne__(self, other: object) -> bool:
         return not self.__eq__(other)
 
     def __hash__(self) -> int:
         if self._hash is None:
+            # Collect the unhashed nodes so that every parent precedes its children, then hash
+            # them in reverse; subtrees that already have a cached hash are never entered
             nodes: list[Expr] = []
-            queue: deque[Expr] = deque()
-            queue.append(self)
+            stack: list[Expr] = [self]
 
-            while queue:
-                node = queue.popleft()
+            while stack:
+                node = stack.pop()
                 nodes.append(node)
 
                 for child in node.iter_expressions():
                     if child._hash is None:
-                        queue.append(child)
+                        stack.append(child)
 
             for node in reversed(nodes):
-                hash_ = hash(node.key)
+                hash_ = node._key_hash
 
                 if node._hash_raw_args:
                     for k, v in sorted(node.args.items()):
@@ -585,6 +614,52 @@ class Expression(Expr):
         assert self._hash
         return self._hash
 
+    def struct_hash(self) -> int:
+        """
+        Returns a hash of this tree's shape, i.e. its node types, the args they occupy and their
+        non-expression args such as flags and keywords, ignoring the values of primitive nodes
+        such as names and literals. The operands of commutative nodes are hashed independently
+        of their order. Like `hash`, the result is cached until the tree is modified.
+        """
+        if self._struct_hash is None:
+            nodes: list[Expr] = []
+            stack: list[Expr] = [self]
+
+            while stack:
+                node = stack.pop()
+                nodes.append(node)
+
+                for child in node.iter_expressions():
+                    if child._struct_hash is None:
+                        stack.append(child)
+
+            for node in reversed(nodes):
+                hash_ = node._key_hash
+
+                if not node.is_primitive:
+                    children: list[t.Any] = []
+
+                    for k, v in sorted(node.args.items()):
+                        vs = v if type(v) is list else (v,)
+
+                        for x in vs:
+                            if isinstance(x, Expr):
+                                children.append(
+                                    x._struct_hash if node._commutative else (k, x._struct_hash)
+                                )
+                            elif x is not None and x is not False:
+                                hash_ = hash((hash_, k, x.lower() if type(x) is str else x))
+
+                    if node._commutative:
+                        children.sort()
+
+                    hash_ = hash((hash_, tuple(children)))
+
+                node._struct_hash = hash_
+
+        assert self._struct_hash is not None
+        return self._struct_hash
+
     def __reduce__(
         self,
     ) -> tuple[
@@ -622,6 +697,8 @@ class Expression(Expr):
         for args that are strings or leaf Expr instances, such as identifiers and literals.
         """
         field = self.args.get(key)
+        if field is None:
+            return ""
         if isinstance(field, str):
             return field
         if isinstance(field, (Identifier, Literal, Var)):
@@ -726,7 +803,10 @@ class Expression(Expr):
         return t is not None and t.is_type(*dtypes)
 
     def is_leaf(self) -> bool:
-        return not any((isinstance(v, Expr) or type(v) is list) and v for v in self.args.values())
+        # Primitive nodes never hold child expressions, so there's nothing to scan
+        return self.is_primitive or not any(
+            (isinstance(v, Expr) or type(v) is list) and v for v in self.args.values()
+        )
 
     @property
     def meta(self) -> dict[str, t.Any]:
@@ -742,29 +822,47 @@ class Expression(Expr):
             node, copy = stack.pop()
 
             if node.comments is not None:
-                copy.comments = deepcopy(node.comments)
+                copy.comments = node.comments.copy()
             if node._type is not None:
-                copy._type = deepcopy(node._type)
+                copy._type = t.cast("DataType", node._type.__deepcopy__(memo))
             if node._meta is not None:
-                copy._meta = deepcopy(node._meta)
+                meta = node._meta
+                # Meta usually only holds scalars, so a shallow copy suffices
+                copy._meta = (
+                    meta.copy()
+                    if all(type(v) in _SCALAR_META_TYPES for v in meta.values())
+                    else deepcopy(meta)
+                )
             if node._hash is not None:
                 copy._hash = node._hash
 
+            # The clones are attached directly rather than through set / append, so that the
+            # hashes carried over from the original tree aren't invalidated along the way
+            args = copy.args
             for k, vs in node.args.items():
                 if isinstance(vs, Expr):
-                    stack.append((vs, vs.__class__()))
-                    copy.set(k, stack[-1][-1])
+                    child = vs.__class__()
+                    child.parent = copy
+                    child.arg_key = k
+                    args[k] = child
+                    stack.append((vs, child))
                 elif type(vs) is list:
-                    copy.args[k] = []
+                    items = []
 
-                    for v in vs:
+                    for i, v in enumerate(vs):
                         if isinstance(v, Expr):
-                            stack.append((v, v.__class__()))
-                            copy.append(k, stack[-1][-1])
+                            child = v.__class__()
+                            child.parent = copy
+                            child.arg_key = k
+                            child.index = i
+                            stack.append((v, child))
+                            items.append(child)
                         else:
-                            copy.append(k, v)
+                            items.append(v)
+
+                    args[k] = items
                 else:
-                    copy.args[k] = vs
+                    args[k] = vs
 
         return root
 
@@ -830,11 +928,7 @@ class Expression(Expr):
             overwrite: assuming an index is given, this determines whether to overwrite the
                 list entry instead of only inserting a new value (i.e., like list.insert).
         """
-        node: Expr | None = self
-
-        while node and node._hash is not None:
-            node._hash = None
-            node = node.parent
+        self._clear_hash()
 
         if index is not None:
             expressions = self.args.get(arg_key) or []
@@ -852,7 +946,10 @@ class Expression(Expr):
                 expressions.pop(index)
                 expressions[index:index] = value
             elif overwrite:
+                # The other siblings keep their positions, so only the new value needs a parent
                 expressions[index] = value
+                self._set_parent(arg_key, value, index)
+                return
             else:
                 expressions.insert(index, value)
 
@@ -869,13 +966,23 @@ class Expression(Expr):
             value.parent = self
             value.arg_key = arg_key
             value.index = index
-        elif isinstance(value, list):
+        elif type(value) is list:
             for i, v in enumerate(value):
                 if isinstance(v, Expr):
                     v.parent = self
                     v.arg_key = arg_key
                     v.index = i
 
+    def _clear_hash(self) -> None:
+        # Cached hashes are cleared bottom-up, so an ancestor whose hashes are already unset has
+        # had its own ancestors cleared too
+        node: Expr | None = self
+
+        while node and (node._hash is not None or node._struct_hash is not None):
+            node._hash = None
+            node._struct_hash = None
+            node = node.parent
+
     def set_kwargs(self, kwargs: Mapping[str, object]) -> Self:
         """Set multiples keyword arguments at once, using `.set()` method.
 
@@ -901,7 +1008,7 @@ class Expression(Expr):
     def iter_expressions(self: E, reverse: bool = False) -> Iterator[E]:
         """Yields the key and expression for all arguments, exploding list args."""
         for vs in reversed(self.args.values()) if reverse else self.args.values():
-            if isinstance(vs, list):
+            if type(vs) is list:
                 for v in reversed(vs) if reverse else vs:
                     if isinstance(v, Expr):
                         yield t.cast(E, v)
@@ -991,10 +1098,10 @@ class Expression(Expr):
         Returns:
             the generator object.
         """
+        # Hand back the traversal generator itself, rather than delegating to it item by item
         if bfs:
-            yield from self.bfs(prune=prune)
-        else:
-            yield from self.dfs(prune=prune)
+            return self.bfs(prune=prune)
+        return self.dfs(prune=prune)
 
     def dfs(self, prune: t.Callable[[Expr], bool] | None = None) -> Iterator[Expr]:
         """
@@ -1006,13 +1113,17 @@ class Expression(Expr):
         """
         stack = [self]
 
-        while stack:
-            node = stack.pop()
-            yield node
-            if prune and prune(node):
-                continue
-            for v in node.iter_expressions(reverse=True):
-                stack.append(v)
+        if prune is None:
+            while stack:
+                node = stack.pop()
+                yield node
+                stack.extend(node.iter_expressions(reverse=True))
+        else:
+            while stack:
+                node = stack.pop()
+                yield node
+                if not prune(node):
+                    stack.extend(node.iter_expressions(reverse=True))
 
     def bfs(self, prune: t.Callable[[Expr], bool] | None = None) -> Iterator[Expr]:
         """
@@ -1025,13 +1136,17 @@ class Expression(Expr):
         queue: deque[Expr] = deque()
         queue.append(self)
 
-        while queue:
-            node = queue.popleft()
-            yield node
-            if prune and prune(node):
-                continue
-            for v in node.iter_expressions():
-                queue.append(v)
+        if prune is None:
+            while queue:
+                node = queue.popleft()
+                yield node
+                queue.extend(node.iter_expressions())
+        else:
+            while queue:
+                node = queue.popleft()
+                yield node
+                if not prune(node):
+                    queue.extend(node.iter_expressions())
 
     def unnest(self) -> Expr:
         """
@@ -1046,15 +1161,13 @@ class Expression(Expr):
         """
         Returns the inner expression if this is an Alias.
         """
-        if isinstance(self, Alias):
-            return self.this
         return self
 
     def unnest_operands(self) -> tuple[Expr, ...]:
         """
         Returns unnested operands as a tuple.
         """
-        return tuple(arg.unnest() for arg in self.iter_expressions())
+        return tuple([arg.unnest() for arg in self.iter_expressions()])
 
     def flatten(self, unnest: bool = True) -> Iterator[Expr]:
         """
@@ -1113,16 +1226,17 @@ class Expression(Expr):
         Returns:
             The transformed tree.
         """
-        root: t.Any = None
         new_node: t.Any = None
+        nodes = (self.copy() if copy else self).dfs(prune=lambda n: n is not new_node)
+
+        # The first node yielded is the root, so handle it outside of the loop
+        root = new_node = fun(next(nodes), *args, **kwargs)
 
-        for node in (self.copy() if copy else self).dfs(prune=lambda n: n is not new_node):
+        for node in nodes:
             parent, arg_key, index = node.parent, node.arg_key, node.index
             new_node = fun(node, *args, **kwargs)
 
-            if not root:
-                root = new_node
-            elif parent and arg_key and new_node is not node:
+            if parent and arg_key and new_node is not node:
                 parent.set(arg_key, new_node, index)
 
         assert root
@@ -1180,7 +1294,32 @@ class Expression(Expr):
         Returns:
             The popped expression.
         """
-        self.replace(None)
+        parent = self.parent
+
+        if parent is None:
+            return self
+
+        key = self.arg_key
+
+        if key:
+            parent._clear_hash()
+
+            index = self.index
+
+            if index is None:
+                parent.args.pop(key, None)
+            else:
+                expressions = parent.args.get(key)
+
+                if expressions and index < len(expressions):
+                    del expressions[index]
+                    for v in expressions[index:]:
+                        v.index -= 1
+
+        self.parent = None
+        self.arg_key = None
+        self.index = None
+
         return self
 
     def assert_is(self, type_: Type[E]) -> E:
@@ -1348,9 +1487,14 @@ class Expression(Expr):
             other_meta = other._meta
             if other_meta:
                 meta = self.meta
-                for k in POSITION_META_KEYS:
-                    if k in other_meta:
-                        meta[k] = other_meta[k]
+                if "line" in other_meta:
+                    meta["line"] = other_meta["line"]
+                if "col" in other_meta:
+                    meta["col"] = other_meta["col"]
+                if "start" in other_meta:
+                    meta["start"] = other_meta["start"]
+                if "end" in other_meta:
+                    meta["end"] = other_meta["end"]
         else:
             meta = self.meta
             meta["line"] = line
@@ -1372,22 +1516,40 @@ class Expression(Expr):
 
     def _binop(self, klass: Type[E], other: t.Any, reverse: bool = False) -> E:
         this = self.copy()
-        other = convert(other, copy=True)
-        if not isinstance(this, klass) and not isinstance(other, klass):
-            this = _wrap(this, Binary)
-            other = _wrap(other, Binary)
+        if isinstance(other, Expr):
+            other = other.copy()
+            if not isinstance(this, klass) and not isinstance(other, klass):
+                this = _wrap(this, Binary)
+                other = _wrap(other, Binary)
+        else:
+            # Python values are converted into nodes which are never Binary, so they don't need
+            # to be wrapped. Plain ints and strings are the most common operands, so build their
+            # literals without going through convert's dispatch. Anything else is converted with
+            # copy=True, since containers may hold Exprs that still belong to another tree.
+            other_type = type(other)
+            if other_type is int:
+                other = Literal.number(other)
+            elif other_type is str:
+                other = Literal.string(other)
+            else:
+                other = convert(other, copy=True)
+            if not isinstance(this, klass):
+                this = _wrap(this, Binary)
         if reverse:
             return klass(this=other, expression=this)
         return klass(this=this, expression=other)
 
     def __getitem__(self, other: ExpOrStr | tuple[ExpOrStr, ...]) -> Bracket:
-        return Bracket(
-            this=self.copy(), expressions=[convert(e, copy=True) for e in ensure_list(other)]
-        )
+        if isinstance(other, (list, tuple)):
+            expressions = [convert(e, copy=True) for e in other]
+        else:
+            expressions = [] if other is None else [convert(other, copy=True)]
+
+        return Bracket(this=self.copy(), expressions=expressions)
 
     def __iter__(self) -> Iterator:
-        if "expressions" in self.arg_types:
-            return iter(self.args.get("expressions") or [])
+        if self._is_iterable:
+            return iter(self.args.get("expressions") or ())
         # We define this because __getitem__ converts Expr into an iterable, which is
         # problematic because one can hit infinite loops if they do "for x in some_expr: ..."
         # See: https://peps.python.org/pep-0234/
@@ -1402,14 +1564,14 @@ class Expression(Expr):
         copy: bool = True,
         **opts: Unpack[ParserNoDialectArgs],
     ) -> In:
-        from sqlglot.expressions.query import Query
+        from sqlglot.expressions.query import Query, Subquery
 
         subquery: Expr | None = None
         if query:
             subquery = maybe_parse(query, dialect=dialect, copy=copy, **opts)
-            if isinstance(subquery, Query):
+            # Subqueries are Queries too, but they're already wrapped
+            if type(subquery) is not Subquery and isinstance(subquery, Query):
                 subquery = subquery.subquery(copy=False)
-        unnest_list: list[ExpOrStr] = ensure_list(unnest)
         return In(
             this=maybe_copy(self, copy),
             expressions=[convert(e, copy=copy) for e in expressions],
@@ -1417,7 +1579,8 @@ class Expression(Expr):
             unnest=(
                 _lazy_unnest(
                     expressions=[
-                        maybe_parse(e, dialect=dialect, copy=copy, **opts) for e in unnest_list
+                        maybe_parse(e, dialect=dialect, copy=copy, **opts)
+                        for e in (unnest if isinstance(unnest, (list, tuple)) else (unnest,))
                     ]
                 )
                 if unnest
@@ -1549,13 +1712,18 @@ ExpOrStr = t.Union[int, str, Expr]
 class Condition(Expr):
     """Logical conditions like x AND y, or simply x"""
 
+    __slots__ = ()
+
 
 @trait
 class Predicate(Condition):
     """Relationships like x = y, x > 1, x >= y."""
 
+    __slots__ = ()
+
 
 class Cache(Expression):
+    __slots__ = ()
     arg_types = {
         "this": True,
         "lazy": False,
@@ -1565,37 +1733,42 @@ class Cache(Expression):
 
 
 class Uncache(Expression):
+    __slots__ = ()
     arg_types = {"this": True, "exists": False}
 
 
 class Refresh(Expression):
+    __slots__ = ()
     arg_types = {"this": True, "kind": True}
 
 
 class LockingStatement(Expression):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True}
 
 
 @trait
 class ColumnConstraintKind(Expr):
-    pass
+    __slots__ = ()
 
 
 @trait
 class SubqueryPredicate(Predicate):
-    pass
+    __slots__ = ()
 
 
 class All(Expression, SubqueryPredicate):
-    pass
+    __slots__ = ()
 
 
 class Any(Expression, SubqueryPredicate):
-    pass
+    __slots__ = ()
 
 
 @trait
 class Binary(Condition):
+    __slots__ = ()
+
     arg_types: t.ClassVar[dict[str, bool]] = {"this": True, "expression": True}
 
     @property
@@ -1609,7 +1782,7 @@ class Binary(Condition):
 
 @trait
 class Connector(Binary):
-    pass
+    __slots__ = ()
 
 
 @trait
@@ -1626,21 +1799,32 @@ class Func(Condition):
             name is set to the expression's class name transformed to snake case.
     """
 
+    __slots__ = ()
+
     is_var_len_args: t.ClassVar[bool] = False
     _sql_names: t.ClassVar[list[str]] = []
+    _resolved_sql_names: t.ClassVar[list[str]] = []
+
+    @classmethod
+    def __init_subclass__(cls, **kwargs: t.Any) -> None:
+        # The explicit form is needed here, mypyc's zero-argument super() doesn't resolve the
+        # subclass correctly when it's called from a trait that extends another trait
+        super(Func, cls).__init_subclass__(**kwargs)  # noqa: UP008
+        # The SQL names are resolved once, instead of on every sql_names() call
+        cls._resolved_sql_names = cls._sql_names or [camel_to_snake_case(cls.__name__)]
 
     @classmethod
     def from_arg_list(cls, args: Sequence[object]) -> Self:
+        arg_keys = cls._arg_keys
+
         if cls.is_var_len_args:
-            all_arg_keys = tuple(cls.arg_types)
             # If this function supports variable length argument treat the last argument as such.
-            non_var_len_arg_keys = all_arg_keys[:-1] if cls.is_var_len_args else all_arg_keys
-            num_non_var = len(non_var_len_arg_keys)
+            num_non_var = len(arg_keys) - 1
 
-            args_dict = {arg_key: arg for arg, arg_key in zip(args, non_var_len_arg_keys)}
-            args_dict[all_arg_keys[-1]] = args[num_non_var:]
+            args_dict = dict(zip(arg_keys[:num_non_var], args))
+            args_dict[arg_keys[-1]] = args[num_non_var:]
         else:
-            args_dict = {arg_key: arg for arg, arg_key in zip(args, cls.arg_types)}
+            args_dict = dict(zip(arg_keys, args))
 
         return cls(**args_dict)
 
@@ -1650,15 +1834,11 @@ class Func(Condition):
             raise NotImplementedError(
                 "SQL name is only supported by concrete function implementations"
             )
-        if not cls._sql_names:
-            return [camel_to_snake_case(cls.__name__)]
-        return cls._sql_names
+        return cls._resolved_sql_names
 
     @classmethod
     def sql_name(cls) -> str:
-        sql_names = cls.sql_names()
-        assert sql_names, f"Expected non-empty 'sql_names' for Func: {cls.__name__}."
-        return sql_names[0]
+        return cls.sql_names()[0]
 
     @classmethod
     def default_parser_mappings(cls) -> dict[str, t.Callable[[Sequence[object]], Self]]:
@@ -1667,10 +1847,11 @@ class Func(Condition):
 
 @trait
 class AggFunc(Func):
-    pass
+    __slots__ = ()
 
 
 class Column(Expression, Condition):
+    __slots__ = ()
     arg_types = {"this": True, "table": False, "db": False, "catalog": False, "join_mark": False}
 
     @property
@@ -1692,9 +1873,14 @@ class Column(Expression, Condition):
     @property
     def parts(self) -> list[Identifier | Star]:
         """Return the parts of a column in order catalog, db, table, name."""
-        return [
-            self.args[part] for part in ("catalog", "db", "table", "this") if self.args.get(part)
-        ]
+        args = self.args
+        this = args.get("this")
+
+        # Most columns are unqualified, so avoid probing every part in that case
+        if not (args.get("table") or args.get("db") or args.get("catalog")):
+            return [this] if this else []
+
+        return [args[part] for part in ("catalog", "db", "table", "this") if args.get(part)]
 
     def to_dot(self, include_dots: bool = True) -> Dot | Identifier | Star:
         """Converts the column into a dot expression."""
@@ -1706,10 +1892,14 @@ class Column(Expression, Condition):
                 parts.append(parent.expression)
                 parent = parent.parent
 
-        return Dot.build(deepcopy(parts)) if len(parts) > 1 else parts[0]
+        if len(parts) == 1:
+            return parts[0]
+
+        return Dot.build([part.copy() for part in parts])
 
 
 class Literal(Expression, Condition):
+    __slots__ = ()
     arg_types = {"this": True, "is_string": True}
     _hash_raw_args = True
     is_primitive = True
@@ -1735,35 +1925,46 @@ class Literal(Expression, Condition):
         return self.name
 
     def to_py(self) -> int | str | Decimal:
-        if self.is_number:
-            try:
-                return int(self.this)
-            except ValueError:
-                return Decimal(self.this)
-        return self.this
+        this = self.this
+        if self.args["is_string"]:
+            return this
+
+        # int() can never parse these, so skip raising and catching a ValueError
+        if "." in this or "e" in this or "E" in this:
+            return Decimal(this)
+
+        try:
+            return int(this)
+        except ValueError:
+            return Decimal(this)
 
 
 class Var(Expression):
+    __slots__ = ()
     is_primitive = True
 
 
 class WithinGroup(Expression):
+    __slots__ = ()
     arg_types = {"this": True, "expression": False}
 
 
 class Pseudocolumn(Column):
-    pass
+    __slots__ = ()
 
 
 class Hint(Expression):
+    __slots__ = ()
     arg_types = {"expressions": True}
 
 
 class JoinHint(Expression):
+    __slots__ = ()
     arg_types = {"this": True, "expressions": True}
 
 
 class Identifier(Expression):
+    __slots__ = ()
     arg_types = {"this": True, "quoted": False, "global_": False, "temporary": False}
     is_primitive = True
     _hash_raw_args = True
@@ -1778,10 +1979,12 @@ class Identifier(Expression):
 
 
 class Opclass(Expression):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True}
 
 
 class Star(Expression):
+    __slots__ = ()
     arg_types = {"except_": False, "replace": False, "rename": False}
 
     @property
@@ -1794,14 +1997,17 @@ class Star(Expression):
 
 
 class Parameter(Expression, Condition):
+    __slots__ = ()
     arg_types = {"this": True, "expression": False}
 
 
 class SessionParameter(Expression, Condition):
+    __slots__ = ()
     arg_types = {"this": True, "kind": False}
 
 
 class Placeholder(Expression, Condition):
+    __slots__ = ()
     arg_types = {"this": False, "kind": False, "widget": False, "jdbc": False}
 
     @property
@@ -1810,6 +2016,7 @@ class Placeholder(Expression, Condition):
 
 
 class Null(Expression, Condition):
+    __slots__ = ()
     arg_types = {}
 
     @property
@@ -1821,6 +2028,7 @@ class Null(Expression, Condition):
 
 
 class Boolean(Expression, Condition):
+    __slots__ = ()
     is_primitive = True
 
     def to_py(self) -> bool:
@@ -1828,6 +2036,8 @@ class Boolean(Expression, Condition):
 
 
 class Dot(Expression, Binary):
+    __slots__ = ()
+
     @property
     def is_star(self) -> bool:
         return self.expression.is_star
@@ -1846,46 +2056,58 @@ class Dot(Expression, Binary):
         if len(expressions) < 2:
             raise ValueError("Dot requires >= 2 expressions.")
 
-        return t.cast(Dot, reduce(lambda x, y: Dot(this=x, expression=y), expressions))
+        dot = Dot(this=expressions[0], expression=expressions[1])
+        for i in range(2, len(expressions)):
+            dot = Dot(this=dot, expression=expressions[i])
+
+        return dot
 
     @property
     def parts(self) -> list[Expr]:
         """Return the parts of a table / column in order catalog, db, table."""
-        this, *parts = self.flatten()
-
-        parts.reverse()
+        this, *rest = self.flatten()
+        args = this.args
 
-        for arg in COLUMN_PARTS:
-            part = this.args.get(arg)
+        parts = []
+        for arg in reversed(COLUMN_PARTS):
+            part = args.get(arg)
 
             if isinstance(part, Expr):
                 parts.append(part)
 
-        parts.reverse()
+        parts.extend(rest)
         return parts
 
 
 class Kwarg(Expression, Binary):
     """Kwarg in special functions like func(kwarg => y)."""
 
+    __slots__ = ()
+
 
 class Alias(Expression):
+    __slots__ = ()
     arg_types = {"this": True, "alias": False}
 
     @property
     def output_name(self) -> str:
         return self.alias
 
+    def unalias(self) -> Expr:
+        return self.this
+
 
 class PivotAlias(Alias):
-    pass
+    __slots__ = ()
 
 
 class PivotAny(Expression):
+    __slots__ = ()
     arg_types = {"this": False}
 
 
 class Aliases(Expression):
+    __slots__ = ()
     arg_types = {"this": True, "expressions": True}
 
     @property
@@ -1894,6 +2116,7 @@ class Aliases(Expression):
 
 
 class Bracket(Expression, Condition):
+    __slots__ = ()
     # https://cloud.google.com/bigquery/docs/reference/standard-sql/operators#array_subscript_operator
     arg_types = {
         "this": True,
@@ -1913,34 +2136,38 @@ class Bracket(Expression, Condition):
 
 
 class ForIn(Expression):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True}
 
 
 class IgnoreNulls(Expression):
-    pass
+    __slots__ = ()
 
 
 class RespectNulls(Expression):
-    pass
+    __slots__ = ()
 
 
 class HavingMax(Expression):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True, "max": True}
 
 
 class SafeFunc(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class Typeof(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class ParameterizedAgg(Expression, AggFunc):
+    __slots__ = ()
     arg_types = {"this": True, "expressions": True, "params": True}
 
 
 class Anonymous(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expressions": False}
     is_var_len_args = True
 
@@ -1950,34 +2177,41 @@ class Anonymous(Expression, Func):
 
 
 class AnonymousAggFunc(Expression, AggFunc):
+    __slots__ = ()
     arg_types = {"this": True, "expressions": False}
     is_var_len_args = True
 
 
 class CombinedAggFunc(AnonymousAggFunc):
+    __slots__ = ()
     arg_types = {"this": True, "expressions": False}
 
 
 class CombinedParameterizedAgg(ParameterizedAgg):
+    __slots__ = ()
     arg_types = {"this": True, "expressions": True, "params": True}
 
 
 class HashAgg(Expression, AggFunc):
+    __slots__ = ()
     arg_types = {"this": True, "expressions": False}
     is_var_len_args = True
 
 
 class Hll(Expression, AggFunc):
+    __slots__ = ()
     arg_types = {"this": True, "expressions": False}
     is_var_len_args = True
 
 
 class ApproxDistinct(Expression, AggFunc):
+    __slots__ = ()
     arg_types = {"this": True, "accuracy": False}
     _sql_names = ["APPROX_DISTINCT", "APPROX_COUNT_DISTINCT"]
 
 
 class Slice(Expression):
+    __slots__ = ()
     arg_types = {"this": False, "expression": False, "step": False}
 
 
@@ -1985,6 +2219,8 @@ class Slice(Expression):
 class TimeUnit(Expr):
     """Automatically converts unit arg into a var."""
 
+    __slots__ = ()
+
     UNABBREVIATED_UNIT_NAME: t.ClassVar[dict[str, str]] = {
         "D": "DAY",
         "H": "HOUR",
@@ -1999,6 +2235,7 @@ class TimeUnit(Expr):
     }
 
     VAR_LIKE: t.ClassVar[tuple[Type[Expr], ...]] = (Column, Literal, Var)
+    VAR_LIKE_SET: t.ClassVar[frozenset[Type[Expr]]] = frozenset(VAR_LIKE)
 
     def __init__(self, **args: object) -> None:
         super().__init__(**args)
@@ -2006,10 +2243,10 @@ class TimeUnit(Expr):
         unit = self.args.get("unit")
         if (
             unit
-            and type(unit) in TimeUnit.VAR_LIKE
-            and not (isinstance(unit, Column) and len(unit.parts) != 1)
+            and type(unit) in TimeUnit.VAR_LIKE_SET
+            and not (type(unit) is Column and len(unit.parts) != 1)
         ):
-            unit = Var(this=(self.UNABBREVIATED_UNIT_NAME.get(unit.name) or unit.name).upper())
+            unit = Var(this=_normalize_unit_name(unit.name))
             self.args["unit"] = unit
             self._set_parent("unit", unit)
         elif type(unit).__name__ == "Week":
@@ -2020,14 +2257,32 @@ class TimeUnit(Expr):
         return self.args.get("unit")
 
 
+# Maps raw unit names to their normalized, interned spelling. Unit vars are attached to a
+# parent, so the nodes themselves can't be shared, but the (small) set of names can.
+_UNIT_NAMES: dict[str, str] = {}
+
+
+def _normalize_unit_name(name: str) -> str:
+    normalized = _UNIT_NAMES.get(name)
+    if normalized is None:
+        normalized = sys.intern((TimeUnit.UNABBREVIATED_UNIT_NAME.get(name) or name).upper())
+        if len(_UNIT_NAMES) < 1024:
+            _UNIT_NAMES[name] = normalized
+    return normalized
+
+
 class _TimeUnit(Expression, TimeUnit):
     """Automatically converts unit arg into a var."""
 
+    __slots__ = ()
+
     arg_types = {"unit": False}
 
 
 @trait
 class IntervalOp(TimeUnit):
+    __slots__ = ()
+
     def interval(self) -> Interval:
         from sqlglot.expressions.datatypes import Interval
 
@@ -2039,14 +2294,16 @@ class IntervalOp(TimeUnit):
 
 
 class Filter(Expression):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True}
 
 
 class Check(Expression):
-    pass
+    __slots__ = ()
 
 
 class Ordered(Expression):
+    __slots__ = ()
     arg_types = {"this": True, "desc": False, "nulls_first": True, "with_fill": False}
 
     @property
@@ -2055,179 +2312,210 @@ class Ordered(Expression):
 
 
 class Add(Expression, Binary):
-    pass
+    __slots__ = ()
 
 
 class BitwiseAnd(Expression, Binary):
+    __slots__ = ()
+
     arg_types = {"this": True, "expression": True, "padside": False}
 
 
 class BitwiseLeftShift(Expression, Binary):
+    __slots__ = ()
+
     arg_types = {"this": True, "expression": True, "requires_int128": False}
 
 
 class BitwiseOr(Expression, Binary):
+    __slots__ = ()
+
     arg_types = {"this": True, "expression": True, "padside": False}
 
 
 class BitwiseRightShift(Expression, Binary):
+    __slots__ = ()
+
     arg_types = {"this": True, "expression": True, "requires_int128": False}
 
 
 class BitwiseXor(Expression, Binary):
+    __slots__ = ()
+
     arg_types = {"this": True, "expression": True, "padside": False}
 
 
 class Div(Expression, Binary):
+    __slots__ = ()
+
     arg_types = {"this": True, "expression": True, "typed": False, "safe": False}
 
 
 class Overlaps(Expression, Binary):
-    pass
+    __slots__ = ()
 
 
 class ExtendsLeft(Expression, Binary):
-    pass
+    __slots__ = ()
 
 
 class ExtendsRight(Expression, Binary):
-    pass
+    __slots__ = ()
 
 
 class DPipe(Expression, Binary):
+    __slots__ = ()
+
     arg_types = {"this": True, "expression": True, "safe": False}
 
 
 class EQ(Expression, Binary, Predicate):
-    pass
+    __slots__ = ()
+    _commutative = True
 
 
 class NullSafeEQ(Expression, Binary, Predicate):
-    pass
+    __slots__ = ()
+    _commutative = True
 
 
 class NullSafeNEQ(Expression, Binary, Predicate):
-    pass
+    __slots__ = ()
+    _commutative = True
 
 
 class PropertyEQ(Expression, Binary):
-    pass
+    __slots__ = ()
 
 
 class Distance(Expression, Binary):
-    pass
+    __slots__ = ()
 
 
 class Escape(Expression, Binary):
-    pass
+    __slots__ = ()
 
 
 class Glob(Expression, Binary, Predicate):
-    pass
+    __slots__ = ()
 
 
 class GT(Expression, Binary, Predicate):
-    pass
+    __slots__ = ()
 
 
 class GTE(Expression, Binary, Predicate):
-    pass
+    __slots__ = ()
 
 
 class ILike(Expression, Binary, Predicate):
-    pass
+    __slots__ = ()
 
 
 class IntDiv(Expression, Binary):
-    pass
+    __slots__ = ()
 
 
 class Is(Expression, Binary, Predicate):
-    pass
+    __slots__ = ()
 
 
 class Like(Expression, Binary, Predicate):
-    pass
+    __slots__ = ()
 
 
 class Match(Expression, Binary, Predicate):
-    pass
+    __slots__ = ()
 
 
 class LT(Expression, Binary, Predicate):
-    pass
+    __slots__ = ()
 
 
 class LTE(Expression, Binary, Predicate):
-    pass
+    __slots__ = ()
 
 
 class Mod(Expression, Binary):
-    pass
+    __slots__ = ()
 
 
 class Mul(Expression, Binary):
-    pass
+    __slots__ = ()
 
 
 class NEQ(Expression, Binary, Predicate):
-    pass
+    __slots__ = ()
+    _commutative = True
 
 
 class NestedJSONSelect(Expression, Binary):
-    pass
+    __slots__ = ()
 
 
 class Operator(Expression, Binary):
+    __slots__ = ()
+
     arg_types = {"this": True, "operator": True, "expression": True}
 
 
 class SimilarTo(Expression, Binary, Predicate):
-    pass
+    __slots__ = ()
 
 
 class Sub(Expression, Binary):
-    pass
+    __slots__ = ()
 
 
 class Adjacent(Expression, Binary):
-    pass
+    __slots__ = ()
 
 
 class Unary(Expression, Condition):
-    pass
+    __slots__ = ()
 
 
 class BitwiseNot(Unary):
-    pass
+    __slots__ = ()
 
 
 class Not(Unary):
-    pass
+    __slots__ = ()
 
 
 class Paren(Unary):
+    __slots__ = ()
+
     @property
     def output_name(self) -> str:
         return self.this.name
 
 
 class Neg(Unary):
+    __slots__ = ()
+
     def to_py(self) -> int | Decimal:
-        if self.is_number:
+        this = self.this
+        # A numeric literal is by far the most common operand, so check for it directly
+        if (isinstance(this, Literal) and not this.args["is_string"]) or (
+            isinstance(this, Neg) and this.is_number
+        ):
             return self.this.to_py() * -1
         return super().to_py()
 
 
 class AtIndex(Expression):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True}
 
 
 class AtTimeZone(Expression):
+    __slots__ = ()
     arg_types = {"this": True, "zone": True}
 
 
 class FromTimeZone(Expression):
+    __slots__ = ()
     arg_types = {"this": True, "zone": True}
 
 
@@ -2238,18 +2526,23 @@ class FormatPhrase(Expression):
     https://docs.teradata.com/r/Enterprise_IntelliFlex_VMware/SQL-Data-Types-and-Literals/Data-Type-Formats-and-Format-Phrases/FORMAT
     """
 
+    __slots__ = ()
+
     arg_types = {"this": True, "format": True}
 
 
 class Between(Expression, Predicate):
+    __slots__ = ()
     arg_types = {"this": True, "low": True, "high": True, "symmetric": False}
 
 
 class Distinct(Expression):
+    __slots__ = ()
     arg_types = {"expressions": False, "on": False}
 
 
 class In(Expression, Predicate):
+    __slots__ = ()
     arg_types = {
         "this": True,
         "expressions": False,
@@ -2261,23 +2554,28 @@ class In(Expression, Predicate):
 
 
 class And(Expression, Connector, Func):
-    pass
+    __slots__ = ()
+    _commutative = True
 
 
 class Or(Expression, Connector, Func):
-    pass
+    __slots__ = ()
+    _commutative = True
 
 
 class Xor(Expression, Connector, Func):
+    __slots__ = ()
     arg_types = {"this": False, "expression": False, "expressions": False, "round_input": False}
     is_var_len_args = True
 
 
 class Pow(Expression, Binary, Func):
+    __slots__ = ()
     _sql_names = ["POWER", "POW"]
 
 
 class RegexpLike(Expression, Binary, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True, "flag": False, "full_match": False}
 
 
@@ -2313,10 +2611,20 @@ def not_(
     return Not(this=_wrap(this, Connector))
 
 
-def _lazy_unnest(**kwargs: object) -> Expr:
-    from sqlglot.expressions.array import Unnest
+# Classes from modules that depend on this one, resolved once on first use
+_LAZY_CLASSES: dict[tuple[str, str], t.Any] = {}
+
 
-    return Unnest(**kwargs)
+def _lazy_class(module: str, name: str) -> t.Any:
+    key = (module, name)
+    cls = _LAZY_CLASSES.get(key)
+    if cls is None:
+        cls = _LAZY_CLASSES[key] = getattr(importlib.import_module(module), name)
+    return cls
+
+
+def _lazy_unnest(**kwargs: object) -> Expr:
+    return _lazy_class("sqlglot.expressions.array", "Unnest")(**kwargs)
 
 
 def convert(value: t.Any, copy: bool = False) -> Expr:
@@ -2331,6 +2639,10 @@ def convert(value: t.Any, copy: bool = False) -> Expr:
     Returns:
         The equivalent expression object.
     """
+    handler = _CONVERTERS.get(type(value))
+    if handler is not None:
+        return handler(value, copy)
+
     if isinstance(value, Expr):
         return maybe_copy(value, copy)
     if isinstance(value, str):
@@ -2342,59 +2654,27 @@ def convert(value: t.Any, copy: bool = False) -> Expr:
     if isinstance(value, numbers.Number):
         return Literal.number(value)
     if isinstance(value, bytes):
-        from sqlglot.expressions.query import HexString as _HexString
-
-        return _HexString(this=value.hex())
+        return _convert_bytes(value, copy)
     if isinstance(value, datetime.datetime):
-        datetime_literal = Literal.string(value.isoformat(sep=" "))
-
-        tz = None
-        if value.tzinfo:
-            # this works for zoneinfo.ZoneInfo, pytz.timezone and datetime.datetime.utc to return IANA timezone names like "America/Los_Angeles"
-            # instead of abbreviations like "PDT". This is for consistency with other timezone handling functions in SQLGlot
-            tz = Literal.string(str(value.tzinfo))
-
-        from sqlglot.expressions.temporal import TimeStrToTime as _TimeStrToTime
-
-        return _TimeStrToTime(this=datetime_literal, zone=tz)
+        return _convert_datetime(value, copy)
     if isinstance(value, datetime.date):
-        date_literal = Literal.string(value.strftime("%Y-%m-%d"))
-        from sqlglot.expressions.temporal import DateStrToDate as _DateStrToDate
-
-        return _DateStrToDate(this=date_literal)
+        return _convert_date(value, copy)
     if isinstance(value, datetime.time):
-        time_literal = Literal.string(value.isoformat())
-        from sqlglot.expressions.temporal import TsOrDsToTime as _TsOrDsToTime
-
-        return _TsOrDsToTime(this=time_literal)
+        return _convert_time(value, copy)
     if isinstance(value, tuple):
         if hasattr(value, "_fields"):
-            from sqlglot.expressions.array import Struct as _Struct
-
-            return _Struct(
-                expressions=[
-                    PropertyEQ(
-                        this=to_identifier(k), expression=convert(getattr(value, k), copy=copy)
-                    )
-                    for k in value._fields
-                ]
-            )
-        from sqlglot.expressions.query import Tuple as _Tuple
-
-        return _Tuple(expressions=[convert(v, copy=copy) for v in value])
+            # There are only a few namedtuple classes in practice, so dispatch them directly
+            # the next time one is converted, e.g. for the remaining rows of a list of records
+            if len(_CONVERTERS) < 1024:
+                _CONVERTERS[type(value)] = _convert_namedtuple
+            return _convert_namedtuple(value, copy)
+        return _convert_tuple(value, copy)
     if isinstance(value, list):
-        from sqlglot.expressions.array import Array as _Array
-
-        return _Array(expressions=[convert(v, copy=copy) for v in value])
+        return _convert_list(value, copy)
     if isinstance(value, dict):
-        from sqlglot.expressions.array import Array as _Array, Map as _Map
-
-        return _Map(
-            keys=_Array(expressions=[convert(k, copy=copy) for k in value]),
-            values=_Array(expressions=[convert(v, copy=copy) for v in value.values()]),
-        )
+        return _convert_dict(value, copy)
     if hasattr(value, "__dict__"):
-        from sqlglot.expressions.array import Struct as _Struct
+        _Struct = _lazy_class("sqlglot.expressions.array", "Struct")
 
         return _Struct(
             expressions=[
@@ -2405,6 +2685,113 @@ def convert(value: t.Any, copy: bool = False) -> Expr:
     raise ValueError(f"Cannot convert {value}")
 
 
+def _convert_str(value: str, copy: bool) -> Expr:
+    return Literal.string(value)
+
+
+def _convert_bool(value: bool, copy: bool) -> Expr:
+    return Boolean(this=value)
+
+
+def _convert_none(value: None, copy: bool) -> Expr:
+    return Null()
+
+
+def _convert_int(value: int, copy: bool) -> Expr:
+    # Same result as Literal.number, without round-tripping the value through to_py for its sign
+    if value < 0:
+        return Neg(this=Literal(this=str(-value), is_string=False))
+    return Literal(this=str(value), is_string=False)
+
+
+def _convert_float(value: float, copy: bool) -> Expr:
+    return Null() if math.isnan(value) else Literal.number(value)
+
+
+def _convert_bytes(value: bytes, copy: bool) -> Expr:
+    return _lazy_class("sqlglot.expressions.query", "HexString")(this=value.hex())
+
+
+def _convert_datetime(value: datetime.datetime, copy: bool) -> Expr:
+    datetime_literal = Literal.string(value.isoformat(sep=" "))
+
+    tz = None
+    if value.tzinfo:
+        # this works for zoneinfo.ZoneInfo, pytz.timezone and datetime.datetime.utc to return IANA timezone names like "America/Los_Angeles"
+        # instead of abbreviations like "PDT". This is for consistency with other timezone handling functions in SQLGlot
+        tz = Literal.string(str(value.tzinfo))
+
+    _TimeStrToTime = _lazy_class("sqlglot.expressions.temporal", "TimeStrToTime")
+
+    return _TimeStrToTime(this=datetime_literal, zone=tz)
+
+
+def _convert_date(value: datetime.date, copy: bool) -> Expr:
+    date_literal = Literal.string(value.strftime("%Y-%m-%d"))
+    _DateStrToDate = _lazy_class("sqlglot.expressions.temporal", "DateStrToDate")
+
+    return _DateStrToDate(this=date_literal)
+
+
+def _convert_time(value: datetime.time, copy: bool) -> Expr:
+    time_literal = Literal.string(value.isoformat())
+    _TsOrDsToTime = _lazy_class("sqlglot.expressions.temporal", "TsOrDsToTime")
+
+    return _TsOrDsToTime(this=time_literal)
+
+
+def _convert_list(value: list, copy: bool) -> Expr:
+    _Array = _lazy_class("sqlglot.expressions.array", "Array")
+
+    return _Array(expressions=[convert(v, copy=copy) for v in value])
+
+
+def _convert_tuple(value: tuple, copy: bool) -> Expr:
+    _Tuple = _lazy_class("sqlglot.expressions.query", "Tuple")
+
+    return _Tuple(expressions=[convert(v, copy=copy) for v in value])
+
+
+def _convert_namedtuple(value: t.Any, copy: bool) -> Expr:
+    _Struct = _lazy_class("sqlglot.expressions.array", "Struct")
+
+    return _Struct(
+        expressions=[
+            PropertyEQ(this=to_identifier(k), expression=convert(v, copy=copy))
+            for k, v in zip(value._fields, value)
+        ]
+    )
+
+
+def _convert_dict(value: dict, copy: bool) -> Expr:
+    _Array = _lazy_class("sqlglot.expressions.array", "Array")
+    _Map = _lazy_class("sqlglot.expressions.array", "Map")
+
+    return _Map(
+        keys=_Array(expressions=[convert(k, copy=copy) for k in value]),
+        values=_Array(expressions=[convert(v, copy=copy) for v in value.values()]),
+    )
+
+
+# Exact-type fast paths for builtin python values; everything else (subclasses, Exprs,
+# objects) goes through the isinstance checks in `convert`. Namedtuple classes are added
+# here by `convert` the first time it sees them.
+_CONVERTERS: dict[type, t.Callable[[t.Any, bool], Expr]] = {
+    str: _convert_str,
+    bool: _convert_bool,
+    type(None): _convert_none,
+    int: _convert_int,
+    float: _convert_float,
+    list: _convert_list,
+    tuple: _convert_tuple,
+    dict: _convert_dict,
+    bytes: _convert_bytes,
+    datetime.datetime: _convert_datetime,
+    datetime.date: _convert_date,
+    datetime.time: _convert_time,
+}
+
+
 QUERY_MODIFIERS = {
     "match": False,
     "laterals": False,
@@ -2502,18 +2889,76 @@ def maybe_parse(
             return sql_or_expression.copy()
         return sql_or_expression
 
+    return _parse_sql(sql_or_expression, into=into, dialect=dialect, prefix=prefix, **opts)
+
+
+def _parse_sql(
+    sql_or_expression: int | str | None,
+    into: IntoType | None = None,
+    dialect: DialectType = None,
+    prefix: str | None = None,
+    **opts: Unpack[ParserNoDialectArgs],
+) -> Expr:
+    """The parsing half of `maybe_parse`, for callers that already ruled out an Expr."""
     if sql_or_expression is None:
         raise ParseError("SQL cannot be None")
 
-    import sqlglot
-
-    sql = str(sql_or_expression)
+    sql = sql_or_expression if type(sql_or_expression) is str else str(sql_or_expression)
     if prefix:
         sql = f"{prefix} {sql}"
 
+    # Builders tend to parse the same short fragments over and over, so these are cached and
+    # handed out as copies. Parser options may log or raise differently, so they're never cached
+    if (
+        not opts
+        and len(sql) <= 256
+        and (dialect is None or type(dialect) is str)
+        and (into is None or isinstance(into, type))
+    ):
+        try:
+            return _parse_sql_cached(sql, into, dialect).copy()  # type: ignore[arg-type]
+        except _LoggedParse as e:
+            return e.expression
+
+    import sqlglot
+
     return sqlglot.parse_one(sql, read=dialect, into=into, **opts)
 
 
+class _LoggedParse(Exception):
+    """
+    Raised out of `_parse_sql_cached` when parsing logged something, so the result isn't cached
+    and the next call parses (and logs) again.
+    """
+
+    def __init__(self, expression: Expr) -> None:
+        super().__init__()
+        self.expression = expression
+
+
+def _parse_sql_once(sql: str, into: Type[Expr] | None, dialect: str | None) -> Expr:
+    import sqlglot
+
+    records: list[logging.LogRecord] = []
+
+    def _record(record: logging.LogRecord) -> bool:
+        records.append(record)
+        return True
+
+    logger.addFilter(_record)
+    try:
+        expression = sqlglot.parse_one(sql, read=dialect, into=into)
+    finally:
+        logger.removeFilter(_record)
+
+    if records:
+        raise _LoggedParse(expression)
+    return expression
+
+
+_parse_sql_cached = lru_cache(maxsize=1024)(_parse_sql_once)
+
+
 @t.overload
 def maybe_copy(instance: None, copy: bool = True) -> None: ...
 
@@ -2528,42 +2973,78 @@ def maybe_copy(instance, copy=True):
 
 def _to_s(node: t.Any, verbose: bool = False, level: int = 0, repr_str: bool = False) -> str:
     """Generate a textual representation of an Expr tree"""
-    indent = "\n" + ("  " * (level + 1))
-    delim = f",{indent}"
+    chunks: list[str] = []
 
-    if isinstance(node, Expr):
-        args = {k: v for k, v in node.args.items() if (v is not None and v != []) or verbose}
+    # Each entry is either a chunk of text to emit as-is, or a (node, level, repr_str) tuple
+    # that still needs to be rendered. Entries are popped in the order they're emitted.
+    stack: list[t.Any] = [(node, level, repr_str)]
 
-        if (node.type or verbose) and type(node).__name__ != "DataType":
-            args["_type"] = node.type
-        if node.comments or verbose:
-            args["_comments"] = node.comments
+    while stack:
+        item = stack.pop()
 
-        if verbose:
-            args["_id"] = id(node)
+        if type(item) is str:
+            chunks.append(item)
+            continue
 
-        # Inline leaves for a more compact representation
-        if node.is_leaf():
-            indent = ""
-            delim = ", "
+        node, level, repr_str = item
+        indent = "\n" + ("  " * (level + 1))
+        delim = f",{indent}"
 
-        repr_str = node.is_string or (isinstance(node, Identifier) and node.quoted)
-        items = delim.join(
-            [f"{k}={_to_s(v, verbose, level + 1, repr_str=repr_str)}" for k, v in args.items()]
-        )
-        return f"{node.__class__.__name__}({indent}{items})"
+        if isinstance(node, Expr):
+            if verbose:
+                args = dict(node.args)
+            else:
+                # Checking the type first avoids going through Expr.__eq__ for every child node
+                args = {
+                    k: v
+                    for k, v in node.args.items()
+                    if v is not None and not (type(v) is list and not v)
+                }
+
+            if (node.type or verbose) and type(node).__name__ != "DataType":
+                args["_type"] = node.type
+            if node.comments or verbose:
+                args["_comments"] = node.comments
+
+            if verbose:
+                args["_id"] = id(node)
+
+            # Inline leaves for a more compact representation
+            if node.is_leaf():
+                indent = ""
+                delim = ", "
+
+            repr_str = node.is_string or (isinstance(node, Identifier) and node.quoted)
+
+            todo: list[t.Any] = [f"{node.__class__.__name__}({indent}"]
+            for i, (k, v) in enumerate(args.items()):
+                todo.append(f"{delim}{k}=" if i else f"{k}=")
+                todo.append((v, level + 1, repr_str))
+            todo.append(")")
+
+            stack.extend(reversed(todo))
+        elif isinstance(node, list):
+            if not node:
+                chunks.append("[]")
+                continue
+
+            todo = [f"[{indent}"]
+            for i, v in enumerate(node):
+                if i:
+                    todo.append(delim)
+                todo.append((v, level + 1, False))
+            todo.append("]")
 
-    if isinstance(node, list):
-        items = delim.join(_to_s(i, verbose, level + 1) for i in node)
-        items = f"{indent}{items}" if items else ""
-        return f"[{items}]"
+            stack.extend(reversed(todo))
+        else:
+            # We use the representation of the string to avoid stripping out important whitespace
+            if repr_str and isinstance(node, str):
+                node = repr(node)
 
-    # We use the representation of the string to avoid stripping out important whitespace
-    if repr_str and isinstance(node, str):
-        node = repr(node)
+            # Indent multiline strings to match the current level
+            chunks.append(indent.join(textwrap.dedent(str(node).strip("\n")).splitlines()))
 
-    # Indent multiline strings to match the current level
-    return indent.join(textwrap.dedent(str(node).strip("\n")).splitlines())
+    return "".join(chunks)
 
 
 def _is_wrong_expression(expression, into):
@@ -2581,16 +3062,11 @@ def _apply_builder(
     into_arg="this",
     **opts: Unpack[ParserNoDialectArgs],
 ) -> E:
-    if _is_wrong_expression(expression, into) and into is not None:
+    if not isinstance(expression, Expr):
+        expression = _parse_sql(expression, prefix=prefix, into=into, dialect=dialect, **opts)
+    elif into is not None and not isinstance(expression, into):
         expression = into(**{into_arg: expression})
     instance = maybe_copy(instance, copy)
-    expression = maybe_parse(
-        sql_or_expression=expression,
-        prefix=prefix,
-        into=into,
-        dialect=dialect,
-        **opts,
-    )
     instance.set(arg, expression)
     return instance
 
@@ -2613,16 +3089,13 @@ def _apply_child_list_builder(
 
     for expression in expressions:
         if expression is not None:
-            if _is_wrong_expression(expression, into) and into is not None:
+            if not isinstance(expression, Expr):
+                expression = _parse_sql(
+                    expression, into=into, dialect=dialect, prefix=prefix, **opts
+                )
+            elif into is not None and not isinstance(expression, into):
                 expression = into(expressions=[expression])
 
-            expression = maybe_parse(
-                expression,
-                into=into,
-                dialect=dialect,
-                prefix=prefix,
-                **opts,
-            )
             for k, v in expression.args.items():
                 if k == "expressions":
                     parsed.extend(v)
@@ -2656,20 +3129,17 @@ def _apply_list_builder(
     inst = maybe_copy(instance, copy)
 
     parsed = [
-        maybe_parse(
-            sql_or_expression=expression,
-            into=into,
-            prefix=prefix,
-            dialect=dialect,
-            **opts,
-        )
+        expression
+        if isinstance(expression, Expr)
+        else _parse_sql(expression, into=into, prefix=prefix, dialect=dialect, **opts)
         for expression in expressions
         if expression is not None
     ]
 
     existing_expressions = inst.args.get(arg)
     if append and existing_expressions:
-        parsed = existing_expressions + parsed
+        existing_expressions.extend(parsed)
+        parsed = existing_expressions
 
     inst.set(arg, parsed)
     return inst
@@ -2709,17 +3179,24 @@ def _combine(
     wrap: bool = True,
     **opts: Unpack[ParserNoDialectArgs],
 ) -> Expr:
-    conditions = [
-        condition(expression, dialect=dialect, copy=copy, **opts)
-        for expression in expressions
-        if expression is not None
-    ]
+    conditions: list[Expr] = []
+    for expression in expressions:
+        if expression is None:
+            continue
+        if isinstance(expression, Expr):
+            # Already built, so there's nothing to parse
+            conditions.append(expression.copy() if copy else expression)
+        else:
+            conditions.append(condition(expression, dialect=dialect, copy=copy, **opts))
 
     this, *rest = conditions
     if rest and wrap:
         this = _wrap(this, Connector)
-    for expression in rest:
-        this = operator(this=this, expression=_wrap(expression, Connector) if wrap else expression)
+        for expression in rest:
+            this = operator(this=this, expression=_wrap(expression, Connector))
+    else:
+        for expression in rest:
+            this = operator(this=this, expression=expression)
 
     return this
 
@@ -2744,14 +3221,36 @@ def _apply_set_operation(
     copy: bool = True,
     **opts: Unpack[ParserNoDialectArgs],
 ) -> t.Any:
-    return reduce(
-        lambda x, y: set_operation(this=x, expression=y, distinct=distinct, **opts),
-        (maybe_parse(e, dialect=dialect, copy=copy, **opts) for e in expressions),
-    )
+    this, *rest = expressions
+    result = maybe_parse(this, dialect=dialect, copy=copy, **opts)
+    for expression in rest:
+        result = set_operation(
+            this=result,
+            expression=maybe_parse(expression, dialect=dialect, copy=copy, **opts),
+            distinct=distinct,
+            **opts,
+        )
+    return result
 
 
 SAFE_IDENTIFIER_RE: t.Pattern[str] = re.compile(r"^[_a-zA-Z][\w]*$")
 
+# Memoizes SAFE_IDENTIFIER_RE matches, since the same few names get built over and over
+_SAFE_IDENTIFIERS: dict[str, bool] = {}
+
+
+def _is_safe_identifier(name: str) -> bool:
+    safe = _SAFE_IDENTIFIERS.get(name)
+    if safe is None:
+        # ASCII Python identifiers are exactly the names the regex accepts as ASCII, so the
+        # regex is only needed for the rest (e.g. unicode names or a trailing newline)
+        safe = (name.isascii() and name.isidentifier()) or (
+            SAFE_IDENTIFIER_RE.match(name) is not None
+        )
+        if len(_SAFE_IDENTIFIERS) < 4096:
+            _SAFE_IDENTIFIERS[name] = safe
+    return safe
+
 
 @t.overload
 def to_identifier(name: None, quoted: bool | None = None, copy: bool = True) -> None: ...
@@ -2783,7 +3282,7 @@ def to_identifier(name, quoted=None, copy=True):
     elif isinstance(name, str):
         identifier = Identifier(
             this=name,
-            quoted=not SAFE_IDENTIFIER_RE.match(name) if quoted is None else quoted,
+            quoted=not _is_safe_identifier(name) if quoted is None else quoted,
         )
     else:
         raise ValueError(f"Name needs to be a string or an Identifier, got: {name.__class__}")
@@ -2975,9 +3474,7 @@ def alias_(
     alias = to_identifier(alias, quoted=quoted)
 
     if table:
-        from sqlglot.expressions.query import TableAlias as _TableAlias
-
-        table_alias = _TableAlias(this=alias)
+        table_alias = _lazy_class("sqlglot.expressions.query", "TableAlias")(this=alias)
         exp.set("alias", table_alias)
 
         if not isinstance(table, bool):
@@ -3054,11 +3551,12 @@ def column(
     if not isinstance(col, Star):
         col = to_identifier(col, quoted=quoted, copy=copy)
 
+    # Most columns are unqualified, so skip the to_identifier calls for missing parts
     this: Column | Dot = Column(
         this=col,
-        table=to_identifier(table, quoted=quoted, copy=copy),
-        db=to_identifier(db, quoted=quoted, copy=copy),
-        catalog=to_identifier(catalog, quoted=quoted, copy=copy),
+        table=None if table is None else to_identifier(table, quoted=quoted, copy=copy),
+        db=None if db is None else to_identifier(db, quoted=quoted, copy=copy),
+        catalog=None if catalog is None else to_identifier(catalog, quoted=quoted, copy=copy),
     )
 
     if fields:
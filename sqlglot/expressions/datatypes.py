@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import typing as t
 from enum import auto
+from functools import lru_cache
 
 from sqlglot.helper import AutoName
 from sqlglot.errors import ErrorLevel, ParseError
@@ -21,6 +22,7 @@ if t.TYPE_CHECKING:
 
 
 class DataTypeParam(Expression):
+    __slots__ = ()
     arg_types = {"this": True, "expression": False}
 
     @property
@@ -170,6 +172,7 @@ class DType(AutoName):
 
 
 class DataType(Expression):
+    __slots__ = ()
     arg_types = {
         "this": True,
         "expressions": False,
@@ -345,26 +348,25 @@ class DataType(Expression):
         Returns:
             The constructed DataType object.
         """
-        from sqlglot import parse_one
-
-        if isinstance(dtype, str):
+        if isinstance(dtype, DataType):
+            return maybe_copy(dtype, copy)
+        elif isinstance(dtype, DType):
+            data_type_exp = DataType(this=dtype)
+        elif isinstance(dtype, str):
             if dtype.upper() == "UNKNOWN":
                 return DataType(this=DType.UNKNOWN, **kwargs)
 
             try:
-                data_type_exp = parse_one(
-                    dtype, read=dialect, into=DataType, error_level=ErrorLevel.IGNORE
-                )
+                if dialect is None or type(dialect) is str:
+                    data_type_exp = _parse_type_cached(dtype, dialect).copy()
+                else:
+                    data_type_exp = _parse_type(dtype, dialect)
             except ParseError:
                 if udt:
                     return DataType(this=DType.USERDEFINED, kind=dtype, **kwargs)
                 raise
-        elif isinstance(dtype, DType):
-            data_type_exp = DataType(this=dtype)
         elif isinstance(dtype, (Identifier, Dot)) and udt:
             return DataType(this=DType.USERDEFINED, kind=dtype, **kwargs)
-        elif isinstance(dtype, DataType):
-            return maybe_copy(dtype, copy)
         else:
             raise ValueError(f"Invalid data type: {type(dtype)}. Expected str or DType")
         if kwargs:
@@ -386,8 +388,26 @@ class DataType(Expression):
             True, if and only if there is a type in `dtypes` which is equal to this DataType.
         """
         self_is_nullable = self.args.get("nullable")
+        this = self.this
+
+        # A bare DType can only match on `this`, unless a structural comparison is needed anyway
+        compare_dtypes = this is not DType.USERDEFINED and not (check_nullable and self_is_nullable)
+
         for dtype in dtypes:
-            other_type = DataType.build(dtype, copy=False, udt=True)
+            if type(dtype) is DType and compare_dtypes:
+                if this == dtype:
+                    return True
+                continue
+
+            if type(dtype) is str and dtype.upper() != "UNKNOWN":
+                # Candidates are only compared against, so build's cached parse is read as-is
+                try:
+                    other_type = _parse_type_cached(dtype, None)
+                except ParseError:
+                    other_type = DataType(this=DType.USERDEFINED, kind=dtype)
+            else:
+                other_type = DataType.build(dtype, copy=False, udt=True)
+
             other_is_nullable = other_type.args.get("nullable")
             if (
                 other_type.expressions
@@ -405,19 +425,34 @@ class DataType(Expression):
 
 
 class PseudoType(DataType):
+    __slots__ = ()
     arg_types = {"this": True}
 
 
 class ObjectIdentifier(DataType):
+    __slots__ = ()
     arg_types = {"this": True}
 
 
 class IntervalSpan(DataType):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True}
 
 
 class Interval(_TimeUnit):
+    __slots__ = ()
     arg_types = {"this": False, "unit": False}
 
 
 DATA_TYPE = t.Union[str, Identifier, Dot, DataType, DType]
+
+
+def _parse_type(dtype: str, dialect: DialectType) -> DataType:
+    from sqlglot import parse_one
+
+    return parse_one(dtype, read=dialect, into=DataType, error_level=ErrorLevel.IGNORE)
+
+
+# The same type strings get built over and over, so DataType.build caches their parsed forms per
+# dialect and hands out copies
+_parse_type_cached = lru_cache(maxsize=1024)(_parse_type)
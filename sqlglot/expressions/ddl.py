@@ -14,6 +14,8 @@ if t.TYPE_CHECKING:
 
 @trait
 class DDL(Selectable):
+    __slots__ = ()
+
     @property
     def ctes(self) -> list[CTE]:
         """Returns a list of all the CTEs attached to this statement."""
@@ -37,6 +39,7 @@ class DDL(Selectable):
 
 
 class Create(Expression, DDL):
+    __slots__ = ()
     arg_types = {
         "with_": False,
         "this": True,
@@ -62,6 +65,7 @@ class Create(Expression, DDL):
 
 
 class SequenceProperties(Expression):
+    __slots__ = ()
     arg_types = {
         "increment": False,
         "minvalue": False,
@@ -74,6 +78,7 @@ class SequenceProperties(Expression):
 
 
 class TriggerProperties(Expression):
+    __slots__ = ()
     arg_types = {
         "table": True,
         "timing": True,
@@ -90,18 +95,21 @@ class TriggerProperties(Expression):
 
 
 class TriggerExecute(Expression):
-    pass
+    __slots__ = ()
 
 
 class TriggerEvent(Expression):
+    __slots__ = ()
     arg_types = {"this": True, "columns": False}
 
 
 class TriggerReferencing(Expression):
+    __slots__ = ()
     arg_types = {"old": False, "new": False}
 
 
 class TruncateTable(Expression):
+    __slots__ = ()
     arg_types = {
         "expressions": True,
         "is_database": False,
@@ -115,10 +123,12 @@ class TruncateTable(Expression):
 
 
 class Clone(Expression):
+    __slots__ = ()
     arg_types = {"this": True, "shallow": False, "copy": False}
 
 
 class Describe(Expression):
+    __slots__ = ()
     arg_types = {
         "this": True,
         "style": False,
@@ -132,10 +142,12 @@ class Describe(Expression):
 
 
 class Attach(Expression):
+    __slots__ = ()
     arg_types = {"this": True, "exists": False, "expressions": False}
 
 
 class Detach(Expression):
+    __slots__ = ()
     arg_types = {
         "this": True,
         "kind": False,
@@ -147,38 +159,46 @@ class Detach(Expression):
 
 
 class Install(Expression):
+    __slots__ = ()
     arg_types = {"this": True, "from_": False, "force": False}
 
 
 class Summarize(Expression):
+    __slots__ = ()
     arg_types = {"this": True, "table": False}
 
 
 class Kill(Expression):
+    __slots__ = ()
     arg_types = {"this": True, "kind": False}
 
 
 class Pragma(Expression):
-    pass
+    __slots__ = ()
 
 
 class Declare(Expression):
+    __slots__ = ()
     arg_types = {"expressions": True, "replace": False}
 
 
 class DeclareItem(Expression):
+    __slots__ = ()
     arg_types = {"this": True, "kind": False, "default": False}
 
 
 class Set(Expression):
+    __slots__ = ()
     arg_types = {"expressions": False, "unset": False, "tag": False}
 
 
 class Heredoc(Expression):
+    __slots__ = ()
     arg_types = {"this": True, "tag": False}
 
 
 class SetItem(Expression):
+    __slots__ = ()
     arg_types = {
         "this": False,
         "expressions": False,
@@ -189,6 +209,7 @@ class SetItem(Expression):
 
 
 class Show(Expression):
+    __slots__ = ()
     arg_types = {
         "this": True,
         "history": False,
@@ -223,14 +244,17 @@ class Show(Expression):
 
 
 class UserDefinedFunction(Expression):
+    __slots__ = ()
     arg_types = {"this": True, "expressions": False, "wrapped": False}
 
 
 class CharacterSet(Expression):
+    __slots__ = ()
     arg_types = {"this": True, "default": False}
 
 
 class AlterColumn(Expression):
+    __slots__ = ()
     arg_types = {
         "this": True,
         "dtype": False,
@@ -246,18 +270,21 @@ class AlterColumn(Expression):
 
 
 class AlterIndex(Expression):
+    __slots__ = ()
     arg_types = {"this": True, "visible": True}
 
 
 class AlterDistStyle(Expression):
-    pass
+    __slots__ = ()
 
 
 class AlterSortKey(Expression):
+    __slots__ = ()
     arg_types = {"this": False, "expressions": False, "compound": False}
 
 
 class AlterSet(Expression):
+    __slots__ = ()
     arg_types = {
         "expressions": False,
         "option": False,
@@ -272,26 +299,30 @@ class AlterSet(Expression):
 
 
 class RenameColumn(Expression):
+    __slots__ = ()
     arg_types = {"this": True, "to": True, "exists": False}
 
 
 class AlterRename(Expression):
-    pass
+    __slots__ = ()
 
 
 class RenameIndex(Expression):
+    __slots__ = ()
     arg_types = {"this": True, "to": True}
 
 
 class AlterModifySqlSecurity(Expression):
+    __slots__ = ()
     arg_types = {"expressions": True}
 
 
 class SwapTable(Expression):
-    pass
+    __slots__ = ()
 
 
 class Comment(Expression):
+    __slots__ = ()
     arg_types = {
         "this": True,
         "kind": True,
@@ -302,6 +333,7 @@ class Comment(Expression):
 
 
 class Comprehension(Expression):
+    __slots__ = ()
     arg_types = {
         "this": True,
         "expression": True,
@@ -312,6 +344,7 @@ class Comprehension(Expression):
 
 
 class MergeTreeTTLAction(Expression):
+    __slots__ = ()
     arg_types = {
         "this": True,
         "delete": False,
@@ -322,6 +355,7 @@ class MergeTreeTTLAction(Expression):
 
 
 class MergeTreeTTL(Expression):
+    __slots__ = ()
     arg_types = {
         "expressions": True,
         "where": False,
@@ -331,6 +365,7 @@ class MergeTreeTTL(Expression):
 
 
 class Drop(Expression):
+    __slots__ = ()
     arg_types = {
         "this": False,
         "kind": False,
@@ -355,22 +390,27 @@ class Drop(Expression):
 
 
 class Command(Expression):
+    __slots__ = ()
     arg_types = {"this": True, "expression": False}
 
 
 class Transaction(Expression):
+    __slots__ = ()
     arg_types = {"this": False, "modes": False, "mark": False}
 
 
 class Commit(Expression):
+    __slots__ = ()
     arg_types = {"chain": False, "this": False, "durability": False}
 
 
 class Rollback(Expression):
+    __slots__ = ()
     arg_types = {"savepoint": False, "this": False}
 
 
 class Alter(Expression):
+    __slots__ = ()
     arg_types = {
         "this": False,
         "kind": True,
@@ -396,18 +436,22 @@ class Alter(Expression):
 
 
 class AlterSession(Expression):
+    __slots__ = ()
     arg_types = {"expressions": True, "unset": False}
 
 
 class Use(Expression):
+    __slots__ = ()
     arg_types = {"this": False, "expressions": False, "kind": False}
 
 
 class NextValueFor(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "order": False}
 
 
 class Execute(Expression):
+    __slots__ = ()
     arg_types = {"this": True, "expressions": False}
 
     @property
@@ -416,4 +460,4 @@ class Execute(Expression):
 
 
 class ExecuteSql(Execute):
-    pass
+    __slots__ = ()
@@ -32,6 +32,8 @@ if t.TYPE_CHECKING:
 class DML(Expr):
     """Trait for data manipulation language statements."""
 
+    __slots__ = ()
+
     def returning(
         self,
         expression: ExpOrStr,
@@ -69,6 +71,7 @@ class DML(Expr):
 
 
 class Delete(Expression, DML):
+    __slots__ = ()
     arg_types = {
         "with_": False,
         "this": False,
@@ -155,14 +158,17 @@ class Delete(Expression, DML):
 
 
 class Export(Expression):
+    __slots__ = ()
     arg_types = {"this": True, "connection": False, "options": True}
 
 
 class CopyParameter(Expression):
+    __slots__ = ()
     arg_types = {"this": True, "expression": False, "expressions": False}
 
 
 class Copy(Expression, DML):
+    __slots__ = ()
     arg_types = {
         "this": True,
         "kind": True,
@@ -174,6 +180,7 @@ class Copy(Expression, DML):
 
 
 class Credentials(Expression):
+    __slots__ = ()
     arg_types = {
         "credentials": False,
         "encryption": False,
@@ -184,14 +191,16 @@ class Credentials(Expression):
 
 
 class Directory(Expression):
+    __slots__ = ()
     arg_types = {"this": True, "local": False, "row_format": False}
 
 
 class DirectoryStage(Expression):
-    pass
+    __slots__ = ()
 
 
 class Insert(Expression, DDL, DML):
+    __slots__ = ()
     arg_types = {
         "hint": False,
         "with_": False,
@@ -262,6 +271,7 @@ class Insert(Expression, DDL, DML):
 
 
 class OnConflict(Expression):
+    __slots__ = ()
     arg_types = {
         "duplicate": False,
         "expressions": False,
@@ -274,10 +284,12 @@ class OnConflict(Expression):
 
 
 class Returning(Expression):
+    __slots__ = ()
     arg_types = {"expressions": True, "into": False}
 
 
 class LoadData(Expression):
+    __slots__ = ()
     arg_types = {
         "this": True,
         "local": False,
@@ -291,6 +303,7 @@ class LoadData(Expression):
 
 
 class Update(Expression, DML):
+    __slots__ = ()
     arg_types = {
         "with_": False,
         "this": False,
@@ -503,6 +516,7 @@ class Update(Expression, DML):
 
 
 class Merge(Expression, DML):
+    __slots__ = ()
     arg_types = {
         "this": True,
         "using": True,
@@ -515,10 +529,13 @@ class Merge(Expression, DML):
 
 
 class When(Expression):
+    __slots__ = ()
     arg_types = {"matched": True, "source": False, "condition": False, "then": True}
 
 
 class Whens(Expression):
     """Wraps around one or more WHEN [NOT] MATCHED [...] clauses."""
 
+    __slots__ = ()
+
     arg_types = {"expressions": True}
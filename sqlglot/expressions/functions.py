@@ -32,6 +32,7 @@ if t.TYPE_CHECKING:
 
 
 class Cast(Expression, Func):
+    __slots__ = ()
     is_cast: t.ClassVar[bool] = True
     arg_types = {
         "this": True,
@@ -70,18 +71,21 @@ class Cast(Expression, Func):
 
 
 class TryCast(Cast):
+    __slots__ = ()
     arg_types = {**Cast.arg_types, "requires_string": False}
 
 
 class JSONCast(Cast):
-    pass
+    __slots__ = ()
 
 
 class CastToStrType(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "to": True}
 
 
 class Convert(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True, "style": False, "safe": False}
 
 
@@ -89,11 +93,13 @@ class Convert(Expression, Func):
 
 
 class If(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "true": True, "false": False}
     _sql_names = ["IF", "IIF"]
 
 
 class Case(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": False, "ifs": True, "default": False}
 
     def when(
@@ -120,62 +126,71 @@ class Case(Expression, Func):
 
 
 class Coalesce(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expressions": False, "is_nvl": False, "is_null": False}
     is_var_len_args = True
     _sql_names = ["COALESCE", "IFNULL", "NVL"]
 
 
 class DecodeCase(Expression, Func):
+    __slots__ = ()
     arg_types = {"expressions": True}
     is_var_len_args = True
 
 
 class EqualNull(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True}
 
 
 class Greatest(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expressions": False, "ignore_nulls": True}
     is_var_len_args = True
 
 
 class Least(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expressions": False, "ignore_nulls": True}
     is_var_len_args = True
 
 
 class Nullif(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True}
 
 
 class Nvl2(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "true": True, "false": False}
 
 
 class Try(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 # Predicates / misc functions
 
 
 class Collate(Expression, Binary, Func):
-    pass
+    __slots__ = ()
 
 
 class Collation(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class ConnectByRoot(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class CheckXml(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "disable_auto_convert": False}
 
 
 class Exists(Expression, Func, SubqueryPredicate):
+    __slots__ = ()
     arg_types = {"this": True, "expression": False}
 
 
@@ -183,133 +198,157 @@ class Exists(Expression, Func, SubqueryPredicate):
 
 
 class Float64(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": False}
 
 
 class Int64(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class IsArray(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class IsNullValue(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class LaxBool(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class LaxFloat64(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class LaxInt64(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class LaxString(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class ToBoolean(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "safe": False}
 
 
 class ToVariant(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 # Session / context functions
 
 
 class CurrentAccount(Expression, Func):
+    __slots__ = ()
     arg_types = {}
 
 
 class CurrentAccountName(Expression, Func):
+    __slots__ = ()
     arg_types = {}
 
 
 class CurrentAvailableRoles(Expression, Func):
+    __slots__ = ()
     arg_types = {}
 
 
 class CurrentCatalog(Expression, Func):
+    __slots__ = ()
     arg_types = {}
 
 
 class CurrentClient(Expression, Func):
+    __slots__ = ()
     arg_types = {}
 
 
 class CurrentDatabase(Expression, Func):
+    __slots__ = ()
     arg_types = {}
 
 
 class CurrentIpAddress(Expression, Func):
+    __slots__ = ()
     arg_types = {}
 
 
 class CurrentOrganizationName(Expression, Func):
+    __slots__ = ()
     arg_types = {}
 
 
 class CurrentOrganizationUser(Expression, Func):
+    __slots__ = ()
     arg_types = {}
 
 
 class CurrentRegion(Expression, Func):
+    __slots__ = ()
     arg_types = {}
 
 
 class CurrentRole(Expression, Func):
+    __slots__ = ()
     arg_types = {}
 
 
 class CurrentRoleType(Expression, Func):
+    __slots__ = ()
     arg_types = {}
 
 
 class CurrentSchema(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": False}
 
 
 class CurrentSchemas(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": False}
 
 
 class CurrentSecondaryRoles(Expression, Func):
+    __slots__ = ()
     arg_types = {}
 
 
 class CurrentSession(Expression, Func):
+    __slots__ = ()
     arg_types = {}
 
 
 class CurrentStatement(Expression, Func):
+    __slots__ = ()
     arg_types = {}
 
 
 class CurrentTransaction(Expression, Func):
+    __slots__ = ()
     arg_types = {}
 
 
 class CurrentUser(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": False}
 
 
 class CurrentVersion(Expression, Func):
+    __slots__ = ()
     arg_types = {}
 
 
 class CurrentWarehouse(Expression, Func):
+    __slots__ = ()
     arg_types = {}
 
 
 class SessionUser(Expression, Func):
+    __slots__ = ()
     arg_types = {}
 
 
@@ -317,61 +356,74 @@ class SessionUser(Expression, Func):
 
 
 class AIClassify(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "categories": True, "config": False}
     _sql_names = ["AI_CLASSIFY"]
 
 
 class AIEmbed(Expression, Func):
+    __slots__ = ()
     arg_types = {"expressions": True}
     is_var_len_args = True
     _sql_names = ["AI_EMBED"]
 
 
 class AISimilarity(Expression, Func):
+    __slots__ = ()
     arg_types = {"expressions": True}
     is_var_len_args = True
     _sql_names = ["AI_SIMILARITY"]
 
 
 class AIGenerate(Expression, Func):
+    __slots__ = ()
     arg_types = {"expressions": True}
     is_var_len_args = True
     _sql_names = ["AI_GENERATE"]
 
 
 class FeaturesAtTime(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "time": False, "num_rows": False, "ignore_feature_nulls": False}
 
 
 class GenerateEmbedding(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True, "params_struct": False, "is_text": False}
 
 
 class GenerateText(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": False, "params_struct": False}
 
 
 class GenerateTable(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": False, "params_struct": False}
 
 
 class GenerateBool(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": False, "params_struct": False}
 
 
 class GenerateInt(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": False, "params_struct": False}
 
 
 class GenerateDouble(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": False, "params_struct": False}
 
 
 class MLForecast(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": False, "params_struct": False}
 
 
 class AIForecast(Expression, Func):
+    __slots__ = ()
     arg_types = {
         "this": True,
         "data_col": False,
@@ -387,14 +439,17 @@ class AIForecast(Expression, Func):
 
 
 class MLTranslate(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True, "params_struct": True}
 
 
 class Predict(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True, "params_struct": False}
 
 
 class VectorSearch(Expression, Func):
+    __slots__ = ()
     arg_types = {
         "this": True,
         "column_to_search": True,
@@ -410,12 +465,14 @@ class VectorSearch(Expression, Func):
 
 
 class ReadCSV(Expression, Func):
+    __slots__ = ()
     _sql_names = ["READ_CSV"]
     is_var_len_args = True
     arg_types = {"this": True, "expressions": False}
 
 
 class ReadParquet(Expression, Func):
+    __slots__ = ()
     is_var_len_args = True
     arg_types = {"expressions": True}
 
@@ -424,16 +481,19 @@ class ReadParquet(Expression, Func):
 
 
 class XMLElement(Expression, Func):
+    __slots__ = ()
     _sql_names = ["XMLELEMENT"]
     arg_types = {"this": True, "expressions": False, "evalname": False}
 
 
 class XMLGet(Expression, Func):
+    __slots__ = ()
     _sql_names = ["XMLGET"]
     arg_types = {"this": True, "expression": True, "instance": False}
 
 
 class XMLTable(Expression, Func):
+    __slots__ = ()
     arg_types = {
         "this": True,
         "namespaces": False,
@@ -447,84 +507,99 @@ class XMLTable(Expression, Func):
 
 
 class Host(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class NetFunc(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class ParseIp(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "type": True, "permissive": False}
 
 
 class RegDomain(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 # Misc utility
 
 
 class Columns(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "unpack": False}
 
 
 class Normal(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "stddev": True, "gen": True}
 
 
 class Rand(Expression, Func):
+    __slots__ = ()
     _sql_names = ["RAND", "RANDOM"]
     arg_types = {"this": False, "lower": False, "upper": False}
 
 
 class Randn(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": False}
 
 
 class Randstr(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "generator": False}
 
 
 class RangeBucket(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True}
 
 
 class RangeN(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expressions": True, "each": False}
 
 
 class Seq1(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": False}
 
 
 class Seq2(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": False}
 
 
 class Seq4(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": False}
 
 
 class Seq8(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": False}
 
 
 class Uniform(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True, "gen": False, "seed": False}
 
 
 class Uuid(Expression, Func):
+    __slots__ = ()
     _sql_names = ["UUID", "GEN_RANDOM_UUID", "GENERATE_UUID", "UUID_STRING"]
 
     arg_types = {"this": False, "name": False, "is_string": False}
 
 
 class WeekStart(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class WidthBucket(Expression, Func):
+    __slots__ = ()
     arg_types = {
         "this": True,
         "min_value": False,
@@ -535,4 +610,5 @@ class WidthBucket(Expression, Func):
 
 
 class Zipf(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "elementcount": True, "gen": True}
@@ -6,10 +6,12 @@ from sqlglot.expressions.core import Expression, Func, AggFunc, Binary, Predicat
 
 
 class CheckJson(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True}
 
 
 class JSONArray(Expression, Func):
+    __slots__ = ()
     arg_types = {
         "expressions": False,
         "null_handling": False,
@@ -19,6 +21,7 @@ class JSONArray(Expression, Func):
 
 
 class JSONArrayAgg(Expression, AggFunc):
+    __slots__ = ()
     arg_types = {
         "this": True,
         "order": False,
@@ -29,61 +32,70 @@ class JSONArrayAgg(Expression, AggFunc):
 
 
 class JSONArrayAppend(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expressions": True}
     is_var_len_args = True
     _sql_names = ["JSON_ARRAY_APPEND"]
 
 
 class JSONArrayContains(Expression, Binary, Predicate, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True, "json_type": False}
     _sql_names = ["JSON_ARRAY_CONTAINS"]
 
 
 class JSONArrayInsert(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expressions": True}
     is_var_len_args = True
     _sql_names = ["JSON_ARRAY_INSERT"]
 
 
 class JSONBContains(Expression, Binary, Func):
+    __slots__ = ()
     _sql_names = ["JSONB_CONTAINS"]
 
 
 class JSONBContainsAllTopKeys(Expression, Binary, Func):
-    pass
+    __slots__ = ()
 
 
 class JSONBContainsAnyTopKeys(Expression, Binary, Func):
-    pass
+    __slots__ = ()
 
 
 class JSONBDeleteAtPath(Expression, Binary, Func):
-    pass
+    __slots__ = ()
 
 
 class JSONBExists(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "path": True}
     _sql_names = ["JSONB_EXISTS"]
 
 
 class JSONBExtract(Expression, Binary, Func):
+    __slots__ = ()
     _sql_names = ["JSONB_EXTRACT"]
 
 
 class JSONBExtractScalar(Expression, Binary, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True, "json_type": False}
     _sql_names = ["JSONB_EXTRACT_SCALAR"]
 
 
 class JSONBObjectAgg(Expression, AggFunc):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True}
 
 
 class JSONBool(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class JSONExists(Expression, Func):
+    __slots__ = ()
     arg_types = {
         "this": True,
         "path": True,
@@ -94,6 +106,7 @@ class JSONExists(Expression, Func):
 
 
 class JSONExtract(Expression, Binary, Func):
+    __slots__ = ()
     arg_types = {
         "this": True,
         "expression": True,
@@ -116,11 +129,13 @@ class JSONExtract(Expression, Binary, Func):
 
 
 class JSONExtractArray(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": False}
     _sql_names = ["JSON_EXTRACT_ARRAY"]
 
 
 class JSONExtractScalar(Expression, Binary, Func):
+    __slots__ = ()
     arg_types = {
         "this": True,
         "expression": True,
@@ -138,21 +153,25 @@ class JSONExtractScalar(Expression, Binary, Func):
 
 
 class JSONFormat(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": False, "options": False, "is_json": False, "to_json": False}
     _sql_names = ["JSON_FORMAT"]
 
 
 class JSONKeys(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": False, "expressions": False}
     is_var_len_args = True
     _sql_names = ["JSON_KEYS"]
 
 
 class JSONKeysAtDepth(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": False, "mode": False}
 
 
 class JSONObject(Expression, Func):
+    __slots__ = ()
     arg_types = {
         "expressions": False,
         "null_handling": False,
@@ -163,6 +182,7 @@ class JSONObject(Expression, Func):
 
 
 class JSONObjectAgg(Expression, AggFunc):
+    __slots__ = ()
     arg_types = {
         "expressions": False,
         "null_handling": False,
@@ -173,18 +193,21 @@ class JSONObjectAgg(Expression, AggFunc):
 
 
 class JSONRemove(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expressions": True}
     is_var_len_args = True
     _sql_names = ["JSON_REMOVE"]
 
 
 class JSONSet(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expressions": True}
     is_var_len_args = True
     _sql_names = ["JSON_SET"]
 
 
 class JSONStripNulls(Expression, Func):
+    __slots__ = ()
     arg_types = {
         "this": True,
         "expression": False,
@@ -195,10 +218,11 @@ class JSONStripNulls(Expression, Func):
 
 
 class StripNullValue(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class JSONTable(Expression, Func):
+    __slots__ = ()
     arg_types = {
         "this": True,
         "schema": True,
@@ -209,15 +233,18 @@ class JSONTable(Expression, Func):
 
 
 class JSONType(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": False}
     _sql_names = ["JSON_TYPE"]
 
 
 class ObjectId(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": False}
 
 
 class ObjectInsert(Expression, Func):
+    __slots__ = ()
     arg_types = {
         "this": True,
         "key": True,
@@ -227,10 +254,12 @@ class ObjectInsert(Expression, Func):
 
 
 class OpenJSON(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "path": False, "expressions": False}
 
 
 class ParseJSON(Expression, Func):
+    __slots__ = ()
     # BigQuery, Snowflake have PARSE_JSON, Presto has JSON_PARSE
     # Snowflake also has TRY_PARSE_JSON, which is represented using `safe`
     _sql_names = ["PARSE_JSON", "JSON_PARSE"]
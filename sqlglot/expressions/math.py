@@ -9,105 +9,111 @@ from sqlglot.expressions.core import Expression, Func, AggFunc
 
 
 class Acos(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class Acosh(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class Asin(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class Asinh(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class Atan(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": False}
 
 
 class Atanh(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class Atan2(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True}
 
 
 class Cos(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class Cosh(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class Cot(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class Coth(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class Csc(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class Csch(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class Degrees(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class Radians(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class Sec(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class Sech(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class Sin(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class Sinh(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class Tan(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class Tanh(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 # Geometric distance / similarity
 
 
 class CosineDistance(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True}
 
 
 class DotProduct(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True}
 
 
 class EuclideanDistance(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True}
 
 
 class JarowinklerSimilarity(Expression, Func):
+    __slots__ = ()
     arg_types = {
         "this": True,
         "expression": True,
@@ -117,6 +123,7 @@ class JarowinklerSimilarity(Expression, Func):
 
 
 class ManhattanDistance(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True}
 
 
@@ -124,51 +131,58 @@ class ManhattanDistance(Expression, Func):
 
 
 class Abs(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class Cbrt(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class Ceil(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "decimals": False, "to": False}
     _sql_names = ["CEIL", "CEILING"]
 
 
 class Exp(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class Factorial(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class Floor(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "decimals": False, "to": False}
 
 
 class IsInf(Expression, Func):
+    __slots__ = ()
     _sql_names = ["IS_INF", "ISINF"]
 
 
 class IsNan(Expression, Func):
+    __slots__ = ()
     _sql_names = ["IS_NAN", "ISNAN"]
 
 
 class Ln(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class Log(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": False}
 
 
 class Pi(Expression, Func):
+    __slots__ = ()
     arg_types = {}
 
 
 class Round(Expression, Func):
+    __slots__ = ()
     arg_types = {
         "this": True,
         "decimals": False,
@@ -178,14 +192,16 @@ class Round(Expression, Func):
 
 
 class Sign(Expression, Func):
+    __slots__ = ()
     _sql_names = ["SIGN", "SIGNUM"]
 
 
 class Sqrt(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class Trunc(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "decimals": False, "fractions_supported": False}
     _sql_names = ["TRUNC", "TRUNCATE"]
 
@@ -194,22 +210,26 @@ class Trunc(Expression, Func):
 
 
 class SafeAdd(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True}
 
 
 class SafeDivide(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True}
 
 
 class SafeMultiply(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True}
 
 
 class SafeNegate(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class SafeSubtract(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True}
 
 
@@ -217,58 +237,62 @@ class SafeSubtract(Expression, Func):
 
 
 class BitwiseAndAgg(Expression, AggFunc):
-    pass
+    __slots__ = ()
 
 
 class BitwiseCount(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class BitwiseOrAgg(Expression, AggFunc):
-    pass
+    __slots__ = ()
 
 
 class BitwiseXorAgg(Expression, AggFunc):
-    pass
+    __slots__ = ()
 
 
 class BitmapBitPosition(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class BitmapBucketNumber(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class BitmapConstructAgg(Expression, AggFunc):
-    pass
+    __slots__ = ()
 
 
 class BitmapCount(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class BitmapOrAgg(Expression, AggFunc):
-    pass
+    __slots__ = ()
 
 
 class Booland(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True, "round_input": False}
 
 
 class Boolnot(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "round_input": False}
 
 
 class Boolor(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True, "round_input": False}
 
 
 class BoolxorAgg(Expression, AggFunc):
-    pass
+    __slots__ = ()
 
 
 class Getbit(Expression, Func):
+    __slots__ = ()
     _sql_names = ["GETBIT", "GET_BIT"]
     # zero_is_msb means the most significant bit is indexed 0
     arg_types = {"this": True, "expression": True, "zero_is_msb": False}
@@ -10,50 +10,62 @@ from sqlglot.expressions.core import Expression, ColumnConstraintKind, Literal,
 
 
 class Property(Expression):
+    __slots__ = ()
     arg_types = {"this": True, "value": True}
 
 
 class GrantPrivilege(Expression):
+    __slots__ = ()
     arg_types = {"this": True, "expressions": False}
 
 
 class GrantPrincipal(Expression):
+    __slots__ = ()
     arg_types = {"this": True, "kind": False}
 
 
 class AllowedValuesProperty(Expression):
+    __slots__ = ()
     arg_types = {"expressions": True}
 
 
 class AlgorithmProperty(Property):
+    __slots__ = ()
     arg_types = {"this": True}
 
 
 class ApiProperty(Property):
+    __slots__ = ()
     arg_types = {}
 
 
 class ApplicationProperty(Property):
+    __slots__ = ()
     arg_types = {}
 
 
 class AutoIncrementProperty(Property):
+    __slots__ = ()
     arg_types = {"this": True}
 
 
 class AutoRefreshProperty(Property):
+    __slots__ = ()
     arg_types = {"this": True}
 
 
 class BackupProperty(Property):
+    __slots__ = ()
     arg_types = {"this": True}
 
 
 class BuildProperty(Property):
+    __slots__ = ()
     arg_types = {"this": True}
 
 
 class BlockCompressionProperty(Property):
+    __slots__ = ()
     arg_types = {
         "autotemp": False,
         "always": False,
@@ -64,30 +76,37 @@ class BlockCompressionProperty(Property):
 
 
 class CatalogProperty(Property):
+    __slots__ = ()
     arg_types = {}
 
 
 class CharacterSetProperty(Property):
+    __slots__ = ()
     arg_types = {"this": True, "default": True}
 
 
 class ChecksumProperty(Property):
+    __slots__ = ()
     arg_types = {"on": False, "default": False}
 
 
 class CollateProperty(Property):
+    __slots__ = ()
     arg_types = {"this": True, "default": False}
 
 
 class ComputeProperty(Property):
+    __slots__ = ()
     arg_types = {}
 
 
 class CopyGrantsProperty(Property):
+    __slots__ = ()
     arg_types = {}
 
 
 class DataBlocksizeProperty(Property):
+    __slots__ = ()
     arg_types = {
         "size": False,
         "units": False,
@@ -98,110 +117,137 @@ class DataBlocksizeProperty(Property):
 
 
 class DataDeletionProperty(Property):
+    __slots__ = ()
     arg_types = {"on": True, "filter_column": False, "retention_period": False}
 
 
 class DatabaseProperty(Property):
+    __slots__ = ()
     arg_types = {}
 
 
 class DefinerProperty(Property):
+    __slots__ = ()
     arg_types = {"this": True}
 
 
 class DistKeyProperty(Property):
+    __slots__ = ()
     arg_types = {"this": True}
 
 
 class DistributedByProperty(Property):
+    __slots__ = ()
     arg_types = {"expressions": False, "kind": True, "buckets": False, "order": False}
 
 
 class DistStyleProperty(Property):
+    __slots__ = ()
     arg_types = {"this": True}
 
 
 class DuplicateKeyProperty(Property):
+    __slots__ = ()
     arg_types = {"expressions": True}
 
 
 class EngineProperty(Property):
+    __slots__ = ()
     arg_types = {"this": True}
 
 
 class UuidProperty(Property):
+    __slots__ = ()
     arg_types = {"this": True}
 
 
 class HeapProperty(Property):
+    __slots__ = ()
     arg_types = {}
 
 
 class HybridProperty(Property):
+    __slots__ = ()
     arg_types = {}
 
 
 class HandlerProperty(Property):
+    __slots__ = ()
     arg_types = {"this": True}
 
 
 class ParameterStyleProperty(Property):
+    __slots__ = ()
     arg_types = {"this": True}
 
 
 class ToTableProperty(Property):
+    __slots__ = ()
     arg_types = {"this": True}
 
 
 class ExecuteAsProperty(Property):
+    __slots__ = ()
     arg_types = {"this": True}
 
 
 class ExternalProperty(Property):
+    __slots__ = ()
     arg_types = {"this": False}
 
 
 class FallbackProperty(Property):
+    __slots__ = ()
     arg_types = {"no": True, "protection": False}
 
 
 class FileFormatProperty(Property):
+    __slots__ = ()
     arg_types = {"this": False, "expressions": False, "hive_format": False}
 
 
 class CredentialsProperty(Property):
+    __slots__ = ()
     arg_types = {"expressions": True}
 
 
 class FreespaceProperty(Property):
+    __slots__ = ()
     arg_types = {"this": True, "percent": False}
 
 
 class GlobalProperty(Property):
+    __slots__ = ()
     arg_types = {}
 
 
 class IcebergProperty(Property):
+    __slots__ = ()
     arg_types = {}
 
 
 class InheritsProperty(Property):
+    __slots__ = ()
     arg_types = {"expressions": True}
 
 
 class InputModelProperty(Property):
+    __slots__ = ()
     arg_types = {"this": True}
 
 
 class OutputModelProperty(Property):
+    __slots__ = ()
     arg_types = {"this": True}
 
 
 class IsolatedLoadingProperty(Property):
+    __slots__ = ()
     arg_types = {"no": False, "concurrent": False, "target": False}
 
 
 class JournalProperty(Property):
+    __slots__ = ()
     arg_types = {
         "no": False,
         "dual": False,
@@ -212,54 +258,66 @@ class JournalProperty(Property):
 
 
 class LanguageProperty(Property):
+    __slots__ = ()
     arg_types = {"this": True}
 
 
 class EnviromentProperty(Property):
+    __slots__ = ()
     arg_types = {"expressions": True}
 
 
 class ClusteredByProperty(Property):
+    __slots__ = ()
     arg_types = {"expressions": True, "sorted_by": False, "buckets": True}
 
 
 class DictProperty(Property):
+    __slots__ = ()
     arg_types = {"this": True, "kind": True, "settings": False}
 
 
 class DictSubProperty(Property):
-    pass
+    __slots__ = ()
 
 
 class DictRange(Property):
+    __slots__ = ()
     arg_types = {"this": True, "min": True, "max": True}
 
 
 class DynamicProperty(Property):
+    __slots__ = ()
     arg_types = {}
 
 
 class OnCluster(Property):
+    __slots__ = ()
     arg_types = {"this": True}
 
 
 class EmptyProperty(Property):
+    __slots__ = ()
     arg_types = {}
 
 
 class LikeProperty(Property):
+    __slots__ = ()
     arg_types = {"this": True, "expressions": False}
 
 
 class LocationProperty(Property):
+    __slots__ = ()
     arg_types = {"this": True}
 
 
 class LockProperty(Property):
+    __slots__ = ()
     arg_types = {"this": True}
 
 
 class LockingProperty(Property):
+    __slots__ = ()
     arg_types = {
         "this": False,
         "kind": True,
@@ -270,82 +328,102 @@ class LockingProperty(Property):
 
 
 class LogProperty(Property):
+    __slots__ = ()
     arg_types = {"no": True}
 
 
 class MaskingProperty(Property):
+    __slots__ = ()
     arg_types = {}
 
 
 class MaterializedProperty(Property):
+    __slots__ = ()
     arg_types = {"this": False}
 
 
 class MergeBlockRatioProperty(Property):
+    __slots__ = ()
     arg_types = {"this": False, "no": False, "default": False, "percent": False}
 
 
 class ModuleProperty(Property):
+    __slots__ = ()
     arg_types = {"this": True, "expressions": False}
 
 
 class NetworkProperty(Property):
+    __slots__ = ()
     arg_types = {}
 
 
 class NoPrimaryIndexProperty(Property):
+    __slots__ = ()
     arg_types = {}
 
 
 class OnProperty(Property):
+    __slots__ = ()
     arg_types = {"this": True}
 
 
 class OnCommitProperty(Property):
+    __slots__ = ()
     arg_types = {"delete": False}
 
 
 class PartitionedByProperty(Property):
+    __slots__ = ()
     arg_types = {"this": True}
 
 
 class PartitionedByBucket(Property):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True}
 
 
 class PartitionByTruncate(Property):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True}
 
 
 class PartitionByRangeProperty(Property):
+    __slots__ = ()
     arg_types = {"partition_expressions": True, "create_expressions": True}
 
 
 class PartitionByRangePropertyDynamic(Expression):
+    __slots__ = ()
     arg_types = {"this": False, "start": True, "end": True, "every": True}
 
 
 class RollupProperty(Property):
+    __slots__ = ()
     arg_types = {"expressions": True}
 
 
 class RollupIndex(Expression):
+    __slots__ = ()
     arg_types = {"this": True, "expressions": True, "from_index": False, "properties": False}
 
 
 class RowAccessProperty(Property):
+    __slots__ = ()
     arg_types = {"this": False, "expressions": False}
 
 
 class PartitionByListProperty(Property):
+    __slots__ = ()
     arg_types = {"partition_expressions": True, "create_expressions": True}
 
 
 class PartitionList(Expression):
+    __slots__ = ()
     arg_types = {"this": True, "expressions": True}
 
 
 class RefreshTriggerProperty(Property):
+    __slots__ = ()
     arg_types = {
         "method": False,
         "kind": False,
@@ -356,10 +434,12 @@ class RefreshTriggerProperty(Property):
 
 
 class UniqueKeyProperty(Property):
+    __slots__ = ()
     arg_types = {"expressions": True}
 
 
 class PartitionBoundSpec(Expression):
+    __slots__ = ()
     # this -> IN / MODULUS, expression -> REMAINDER, from_expressions -> FROM (...), to_expressions -> TO (...)
     arg_types = {
         "this": False,
@@ -370,31 +450,38 @@ class PartitionBoundSpec(Expression):
 
 
 class PartitionedOfProperty(Property):
+    __slots__ = ()
     # this -> parent_table (schema), expression -> FOR VALUES ... / DEFAULT
     arg_types = {"this": True, "expression": True}
 
 
 class StreamingTableProperty(Property):
+    __slots__ = ()
     arg_types = {}
 
 
 class RemoteWithConnectionModelProperty(Property):
+    __slots__ = ()
     arg_types = {"this": True}
 
 
 class ReturnsProperty(Property):
+    __slots__ = ()
     arg_types = {"this": False, "is_table": False, "table": False, "null": False}
 
 
 class StrictProperty(Property):
+    __slots__ = ()
     arg_types = {}
 
 
 class RowFormatProperty(Property):
+    __slots__ = ()
     arg_types = {"this": True}
 
 
 class RowFormatDelimitedProperty(Property):
+    __slots__ = ()
     # https://cwiki.apache.org/confluence/display/hive/languagemanual+dml
     arg_types = {
         "fields": False,
@@ -408,10 +495,12 @@ class RowFormatDelimitedProperty(Property):
 
 
 class RowFormatSerdeProperty(Property):
+    __slots__ = ()
     arg_types = {"this": True, "serde_properties": False}
 
 
 class QueryTransform(Expression):
+    __slots__ = ()
     arg_types = {
         "expressions": True,
         "command_script": True,
@@ -424,14 +513,17 @@ class QueryTransform(Expression):
 
 
 class SampleProperty(Property):
+    __slots__ = ()
     arg_types = {"this": True}
 
 
 class SchemaCommentProperty(Property):
+    __slots__ = ()
     arg_types = {"this": True}
 
 
 class SemanticView(Expression):
+    __slots__ = ()
     arg_types = {
         "this": True,
         "metrics": False,
@@ -442,67 +534,83 @@ class SemanticView(Expression):
 
 
 class SerdeProperties(Property):
+    __slots__ = ()
     arg_types = {"expressions": True, "with_": False}
 
 
 class SetProperty(Property):
+    __slots__ = ()
     arg_types = {"multi": True}
 
 
 class SharingProperty(Property):
+    __slots__ = ()
     arg_types = {"this": False}
 
 
 class SetConfigProperty(Property):
+    __slots__ = ()
     arg_types = {"this": True}
 
 
 class SettingsProperty(Property):
+    __slots__ = ()
     arg_types = {"expressions": True}
 
 
 class SortKeyProperty(Property):
+    __slots__ = ()
     arg_types = {"this": True, "compound": False}
 
 
 class SqlReadWriteProperty(Property):
+    __slots__ = ()
     arg_types = {"this": True}
 
 
 class SqlSecurityProperty(Property):
+    __slots__ = ()
     arg_types = {"this": True}
 
 
 class StabilityProperty(Property):
+    __slots__ = ()
     arg_types = {"this": True}
 
 
 class StorageHandlerProperty(Property):
+    __slots__ = ()
     arg_types = {"this": True}
 
 
 class UsingProperty(Property):
+    __slots__ = ()
     # kind: JAR, FILE, or ARCHIVE; this: the resource path (string literal)
     arg_types = {"this": True, "kind": True}
 
 
 class TemporaryProperty(Property):
+    __slots__ = ()
     arg_types = {"this": False}
 
 
 class VirtualProperty(Property):
+    __slots__ = ()
     arg_types = {}
 
 
 class SecureProperty(Property):
+    __slots__ = ()
     arg_types = {}
 
 
 class SecurityIntegrationProperty(Property):
+    __slots__ = ()
     arg_types = {}
 
 
 class Tags(Property, ColumnConstraintKind):
+    __slots__ = ()
     arg_types = {"expressions": True}
 
 
@@ -518,42 +626,52 @@ class PropertiesLocation(AutoName):
 
 
 class TransformModelProperty(Property):
+    __slots__ = ()
     arg_types = {"expressions": True}
 
 
 class TransientProperty(Property):
+    __slots__ = ()
     arg_types = {"this": False}
 
 
 class UnloggedProperty(Property):
+    __slots__ = ()
     arg_types = {}
 
 
 class UsingTemplateProperty(Property):
+    __slots__ = ()
     arg_types = {"this": True}
 
 
 class ViewAttributeProperty(Property):
+    __slots__ = ()
     arg_types = {"this": True}
 
 
 class VolatileProperty(Property):
+    __slots__ = ()
     arg_types = {"this": False}
 
 
 class WithDataProperty(Property):
+    __slots__ = ()
     arg_types = {"no": True, "statistics": False}
 
 
 class WithJournalTableProperty(Property):
+    __slots__ = ()
     arg_types = {"this": True}
 
 
 class WithSchemaBindingProperty(Property):
+    __slots__ = ()
     arg_types = {"this": True}
 
 
 class WithSystemVersioningProperty(Property):
+    __slots__ = ()
     arg_types = {
         "on": False,
         "this": False,
@@ -564,22 +682,27 @@ class WithSystemVersioningProperty(Property):
 
 
 class WithProcedureOptions(Property):
+    __slots__ = ()
     arg_types = {"expressions": True}
 
 
 class EncodeProperty(Property):
+    __slots__ = ()
     arg_types = {"this": True, "properties": False, "key": False}
 
 
 class IncludeProperty(Property):
+    __slots__ = ()
     arg_types = {"this": True, "alias": False, "column_def": False}
 
 
 class ForceProperty(Property):
+    __slots__ = ()
     arg_types = {}
 
 
 class Properties(Expression):
+    __slots__ = ()
     arg_types = {"expressions": True}
 
     NAME_TO_PROPERTY: t.ClassVar[dict[str, type[Property]]] = {
@@ -77,6 +77,8 @@ def _apply_cte_builder(
 
 @trait
 class Selectable(Expr):
+    __slots__ = ()
+
     @property
     def selects(self) -> list[Expr]:
         raise NotImplementedError("Subclasses must implement selects")
@@ -93,6 +95,8 @@ def _named_selects(self: Expr) -> list[str]:
 
 @trait
 class DerivedTable(Selectable):
+    __slots__ = ()
+
     @property
     def selects(self) -> list[Expr]:
         this = self.this
@@ -101,6 +105,8 @@ class DerivedTable(Selectable):
 
 @trait
 class UDTF(DerivedTable):
+    __slots__ = ()
+
     @property
     def selects(self) -> list[Expr]:
         alias = self.args.get("alias")
@@ -111,6 +117,8 @@ class UDTF(DerivedTable):
 class Query(Selectable):
     """Trait for any SELECT/UNION/etc. query expression."""
 
+    __slots__ = ()
+
     @property
     def ctes(self) -> list[CTE]:
         with_ = self.args.get("with_")
@@ -435,14 +443,17 @@ class Query(Selectable):
 
 
 class QueryBand(Expression):
+    __slots__ = ()
     arg_types = {"this": True, "scope": False, "update": False}
 
 
 class RecursiveWithSearch(Expression):
+    __slots__ = ()
     arg_types = {"kind": True, "this": True, "expression": True, "using": False}
 
 
 class With(Expression):
+    __slots__ = ()
     arg_types = {"expressions": True, "recursive": False, "search": False}
 
     @property
@@ -451,6 +462,7 @@ class With(Expression):
 
 
 class CTE(Expression, DerivedTable):
+    __slots__ = ()
     arg_types = {
         "this": True,
         "alias": True,
@@ -461,10 +473,12 @@ class CTE(Expression, DerivedTable):
 
 
 class ProjectionDef(Expression):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True}
 
 
 class TableAlias(Expression):
+    __slots__ = ()
     arg_types = {"this": False, "columns": False}
 
     @property
@@ -473,32 +487,39 @@ class TableAlias(Expression):
 
 
 class BitString(Expression, Condition):
+    __slots__ = ()
     is_primitive = True
 
 
 class HexString(Expression, Condition):
+    __slots__ = ()
     arg_types = {"this": True, "is_integer": False}
     is_primitive = True
 
 
 class ByteString(Expression, Condition):
+    __slots__ = ()
     arg_types = {"this": True, "is_bytes": False}
     is_primitive = True
 
 
 class RawString(Expression, Condition):
+    __slots__ = ()
     is_primitive = True
 
 
 class UnicodeString(Expression, Condition):
+    __slots__ = ()
     arg_types = {"this": True, "escape": False}
 
 
 class ColumnPosition(Expression):
+    __slots__ = ()
     arg_types = {"this": False, "position": True}
 
 
 class ColumnDef(Expression):
+    __slots__ = ()
     arg_types = {
         "this": True,
         "kind": False,
@@ -519,18 +540,21 @@ class ColumnDef(Expression):
 
 
 class Changes(Expression):
+    __slots__ = ()
     arg_types = {"information": True, "at_before": False, "end": False}
 
 
 class Connect(Expression):
+    __slots__ = ()
     arg_types = {"start": False, "connect": True, "nocycle": False}
 
 
 class Prior(Expression):
-    pass
+    __slots__ = ()
 
 
 class Into(Expression):
+    __slots__ = ()
     arg_types = {
         "this": False,
         "temporary": False,
@@ -541,6 +565,8 @@ class Into(Expression):
 
 
 class From(Expression):
+    __slots__ = ()
+
     @property
     def name(self) -> str:
         return self.this.name
@@ -551,10 +577,11 @@ class From(Expression):
 
 
 class Having(Expression):
-    pass
+    __slots__ = ()
 
 
 class Index(Expression):
+    __slots__ = ()
     arg_types = {
         "this": False,
         "table": False,
@@ -566,38 +593,46 @@ class Index(Expression):
 
 
 class ConditionalInsert(Expression):
+    __slots__ = ()
     arg_types = {"this": True, "expression": False, "else_": False}
 
 
 class MultitableInserts(Expression):
+    __slots__ = ()
     arg_types = {"expressions": True, "kind": True, "source": True}
 
 
 class OnCondition(Expression):
+    __slots__ = ()
     arg_types = {"error": False, "empty": False, "null": False}
 
 
 class Introducer(Expression):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True}
 
 
 class National(Expression):
+    __slots__ = ()
     is_primitive = True
 
 
 class Partition(Expression):
+    __slots__ = ()
     arg_types = {"expressions": True, "subpartition": False}
 
 
 class PartitionRange(Expression):
+    __slots__ = ()
     arg_types = {"this": True, "expression": False, "expressions": False}
 
 
 class PartitionId(Expression):
-    pass
+    __slots__ = ()
 
 
 class Fetch(Expression):
+    __slots__ = ()
     arg_types = {
         "direction": False,
         "count": False,
@@ -606,6 +641,7 @@ class Fetch(Expression):
 
 
 class Grant(Expression):
+    __slots__ = ()
     arg_types = {
         "privileges": True,
         "kind": False,
@@ -616,10 +652,12 @@ class Grant(Expression):
 
 
 class Revoke(Expression):
+    __slots__ = ()
     arg_types = {**Grant.arg_types, "cascade": False}
 
 
 class Group(Expression):
+    __slots__ = ()
     arg_types = {
         "expressions": False,
         "grouping_sets": False,
@@ -631,22 +669,27 @@ class Group(Expression):
 
 
 class Cube(Expression):
+    __slots__ = ()
     arg_types = {"expressions": False}
 
 
 class Rollup(Expression):
+    __slots__ = ()
     arg_types = {"expressions": False}
 
 
 class GroupingSets(Expression):
+    __slots__ = ()
     arg_types = {"expressions": True}
 
 
 class Lambda(Expression):
+    __slots__ = ()
     arg_types = {"this": True, "expressions": True, "colon": False}
 
 
 class Limit(Expression):
+    __slots__ = ()
     arg_types = {
         "this": False,
         "expression": True,
@@ -657,6 +700,7 @@ class Limit(Expression):
 
 
 class LimitOptions(Expression):
+    __slots__ = ()
     arg_types = {
         "percent": False,
         "rows": False,
@@ -665,6 +709,7 @@ class LimitOptions(Expression):
 
 
 class Join(Expression):
+    __slots__ = ()
     arg_types = {
         "this": True,
         "on": False,
@@ -793,6 +838,7 @@ class Join(Expression):
 
 
 class Lateral(Expression, UDTF):
+    __slots__ = ()
     arg_types = {
         "this": True,
         "view": False,
@@ -804,6 +850,7 @@ class Lateral(Expression, UDTF):
 
 
 class TableFromRows(Expression, UDTF):
+    __slots__ = ()
     arg_types = {
         "this": True,
         "alias": False,
@@ -814,6 +861,7 @@ class TableFromRows(Expression, UDTF):
 
 
 class MatchRecognizeMeasure(Expression):
+    __slots__ = ()
     arg_types = {
         "this": True,
         "window_frame": False,
@@ -821,6 +869,7 @@ class MatchRecognizeMeasure(Expression):
 
 
 class MatchRecognize(Expression):
+    __slots__ = ()
     arg_types = {
         "partition_by": False,
         "order": False,
@@ -834,18 +883,21 @@ class MatchRecognize(Expression):
 
 
 class Final(Expression):
-    pass
+    __slots__ = ()
 
 
 class Offset(Expression):
+    __slots__ = ()
     arg_types = {"this": False, "expression": True, "expressions": False}
 
 
 class Order(Expression):
+    __slots__ = ()
     arg_types = {"this": False, "expressions": True, "siblings": False}
 
 
 class WithFill(Expression):
+    __slots__ = ()
     arg_types = {
         "from_": False,
         "to": False,
@@ -855,34 +907,37 @@ class WithFill(Expression):
 
 
 class SkipJSONColumn(Expression):
+    __slots__ = ()
     arg_types = {"regexp": False, "expression": True}
 
 
 class Cluster(Order):
-    pass
+    __slots__ = ()
 
 
 class Distribute(Order):
-    pass
+    __slots__ = ()
 
 
 class Sort(Order):
-    pass
+    __slots__ = ()
 
 
 class Qualify(Expression):
-    pass
+    __slots__ = ()
 
 
 class InputOutputFormat(Expression):
+    __slots__ = ()
     arg_types = {"input_format": False, "output_format": False}
 
 
 class Return(Expression):
-    pass
+    __slots__ = ()
 
 
 class Tuple(Expression):
+    __slots__ = ()
     arg_types = {"expressions": False}
 
     def isin(
@@ -911,30 +966,37 @@ class Tuple(Expression):
 
 
 class QueryOption(Expression):
+    __slots__ = ()
     arg_types = {"this": True, "expression": False}
 
 
 class WithTableHint(Expression):
+    __slots__ = ()
     arg_types = {"expressions": True}
 
 
 class IndexTableHint(Expression):
+    __slots__ = ()
     arg_types = {"this": True, "expressions": False, "target": False}
 
 
 class HistoricalData(Expression):
+    __slots__ = ()
     arg_types = {"this": True, "kind": True, "expression": True}
 
 
 class Put(Expression):
+    __slots__ = ()
     arg_types = {"this": True, "target": True, "properties": False}
 
 
 class Get(Expression):
+    __slots__ = ()
     arg_types = {"this": True, "target": True, "properties": False}
 
 
 class Table(Expression, Selectable):
+    __slots__ = ()
     arg_types = {
         "this": False,
         "alias": False,
@@ -1013,6 +1075,7 @@ class Table(Expression, Selectable):
 
 
 class SetOperation(Expression, Query):
+    __slots__ = ()
     arg_types = {
         "with_": False,
         "this": True,
@@ -1076,18 +1139,19 @@ class SetOperation(Expression, Query):
 
 
 class Union(SetOperation):
-    pass
+    __slots__ = ()
 
 
 class Except(SetOperation):
-    pass
+    __slots__ = ()
 
 
 class Intersect(SetOperation):
-    pass
+    __slots__ = ()
 
 
 class Values(Expression, UDTF):
+    __slots__ = ()
     arg_types = {
         "expressions": True,
         "alias": False,
@@ -1108,18 +1172,23 @@ class Version(Expression):
     kind is ("AS OF", "BETWEEN")
     """
 
+    __slots__ = ()
+
     arg_types = {"this": True, "kind": True, "expression": False}
 
 
 class Schema(Expression):
+    __slots__ = ()
     arg_types = {"this": False, "expressions": False}
 
 
 class Lock(Expression):
+    __slots__ = ()
     arg_types = {"update": True, "expressions": False, "wait": False, "key": False}
 
 
 class Select(Expression, Query):
+    __slots__ = ()
     arg_types = {
         "with_": False,
         "kind": False,
@@ -1659,6 +1728,7 @@ class Select(Expression, Query):
 
 
 class Subquery(Expression, DerivedTable, Query):
+    __slots__ = ()
     is_subquery: t.ClassVar[bool] = True
     arg_types = {
         "this": True,
@@ -1715,6 +1785,7 @@ class Subquery(Expression, DerivedTable, Query):
 
 
 class TableSample(Expression):
+    __slots__ = ()
     arg_types = {
         "expressions": False,
         "method": False,
@@ -1731,6 +1802,8 @@ class TableSample(Expression):
 class Tag(Expression):
     """Tags are used for generating arbitrary sql like SELECT <span>x</span>."""
 
+    __slots__ = ()
+
     arg_types = {
         "this": False,
         "prefix": False,
@@ -1739,6 +1812,7 @@ class Tag(Expression):
 
 
 class Pivot(Expression):
+    __slots__ = ()
     arg_types = {
         "this": False,
         "alias": False,
@@ -1764,10 +1838,12 @@ class Pivot(Expression):
 
 
 class UnpivotColumns(Expression):
+    __slots__ = ()
     arg_types = {"this": True, "expressions": True}
 
 
 class Window(Expression, Condition):
+    __slots__ = ()
     arg_types = {
         "this": True,
         "partition_by": False,
@@ -1780,6 +1856,7 @@ class Window(Expression, Condition):
 
 
 class WindowSpec(Expression):
+    __slots__ = ()
     arg_types = {
         "kind": False,
         "start": False,
@@ -1791,14 +1868,15 @@ class WindowSpec(Expression):
 
 
 class PreWhere(Expression):
-    pass
+    __slots__ = ()
 
 
 class Where(Expression):
-    pass
+    __slots__ = ()
 
 
 class Analyze(Expression):
+    __slots__ = ()
     arg_types = {
         "kind": False,
         "this": False,
@@ -1811,6 +1889,7 @@ class Analyze(Expression):
 
 
 class AnalyzeStatistics(Expression):
+    __slots__ = ()
     arg_types = {
         "kind": True,
         "option": False,
@@ -1820,6 +1899,7 @@ class AnalyzeStatistics(Expression):
 
 
 class AnalyzeHistogram(Expression):
+    __slots__ = ()
     arg_types = {
         "this": True,
         "expressions": True,
@@ -1829,22 +1909,27 @@ class AnalyzeHistogram(Expression):
 
 
 class AnalyzeSample(Expression):
+    __slots__ = ()
     arg_types = {"kind": True, "sample": True}
 
 
 class AnalyzeListChainedRows(Expression):
+    __slots__ = ()
     arg_types = {"expression": False}
 
 
 class AnalyzeDelete(Expression):
+    __slots__ = ()
     arg_types = {"kind": False}
 
 
 class AnalyzeWith(Expression):
+    __slots__ = ()
     arg_types = {"expressions": True}
 
 
 class AnalyzeValidate(Expression):
+    __slots__ = ()
     arg_types = {
         "kind": True,
         "this": False,
@@ -1853,42 +1938,50 @@ class AnalyzeValidate(Expression):
 
 
 class AnalyzeColumns(Expression):
-    pass
+    __slots__ = ()
 
 
 class UsingData(Expression):
-    pass
+    __slots__ = ()
 
 
 class AddPartition(Expression):
+    __slots__ = ()
     arg_types = {"this": True, "exists": False, "location": False}
 
 
 class AttachOption(Expression):
+    __slots__ = ()
     arg_types = {"this": True, "expression": False}
 
 
 class DropPartition(Expression):
+    __slots__ = ()
     arg_types = {"expressions": True, "exists": False}
 
 
 class ReplacePartition(Expression):
+    __slots__ = ()
     arg_types = {"expression": True, "source": True}
 
 
 class TranslateCharacters(Expression):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True, "with_error": False}
 
 
 class OverflowTruncateBehavior(Expression):
+    __slots__ = ()
     arg_types = {"this": False, "with_count": True}
 
 
 class JSON(Expression):
+    __slots__ = ()
     arg_types = {"this": False, "with_": False, "unique": False}
 
 
 class JSONPath(Expression):
+    __slots__ = ()
     arg_types = {"expressions": True, "escape": False}
 
     @property
@@ -1898,58 +1991,69 @@ class JSONPath(Expression):
 
 
 class JSONPathPart(Expression):
+    __slots__ = ()
     arg_types = {}
 
 
 class JSONPathFilter(JSONPathPart):
+    __slots__ = ()
     arg_types = {"this": True}
 
 
 class JSONPathKey(JSONPathPart):
+    __slots__ = ()
     arg_types = {"this": True}
 
 
 class JSONPathRecursive(JSONPathPart):
+    __slots__ = ()
     arg_types = {"this": False}
 
 
 class JSONPathRoot(JSONPathPart):
-    pass
+    __slots__ = ()
 
 
 class JSONPathScript(JSONPathPart):
+    __slots__ = ()
     arg_types = {"this": True}
 
 
 class JSONPathSlice(JSONPathPart):
+    __slots__ = ()
     arg_types = {"start": False, "end": False, "step": False}
 
 
 class JSONPathSelector(JSONPathPart):
+    __slots__ = ()
     arg_types = {"this": True}
 
 
 class JSONPathSubscript(JSONPathPart):
+    __slots__ = ()
     arg_types = {"this": True}
 
 
 class JSONPathUnion(JSONPathPart):
+    __slots__ = ()
     arg_types = {"expressions": True}
 
 
 class JSONPathWildcard(JSONPathPart):
-    pass
+    __slots__ = ()
 
 
 class FormatJson(Expression):
-    pass
+    __slots__ = ()
 
 
 class JSONKeyValue(Expression):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True}
 
 
 class JSONColumnDef(Expression):
+    __slots__ = ()
     arg_types = {
         "this": False,
         "kind": False,
@@ -1960,10 +2064,12 @@ class JSONColumnDef(Expression):
 
 
 class JSONSchema(Expression):
+    __slots__ = ()
     arg_types = {"expressions": True}
 
 
 class JSONValue(Expression):
+    __slots__ = ()
     arg_types = {
         "this": True,
         "path": True,
@@ -1973,14 +2079,17 @@ class JSONValue(Expression):
 
 
 class JSONValueArray(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": False}
 
 
 class OpenJSONColumnDef(Expression):
+    __slots__ = ()
     arg_types = {"this": True, "kind": True, "path": False, "as_json": False}
 
 
 class JSONExtractQuote(Expression):
+    __slots__ = ()
     arg_types = {
         "option": True,
         "scalar": False,
@@ -1988,54 +2097,63 @@ class JSONExtractQuote(Expression):
 
 
 class ScopeResolution(Expression):
+    __slots__ = ()
     arg_types = {"this": False, "expression": True}
 
 
 class Stream(Expression):
-    pass
+    __slots__ = ()
 
 
 class ModelAttribute(Expression):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True}
 
 
 class XMLNamespace(Expression):
-    pass
+    __slots__ = ()
 
 
 class XMLKeyValueOption(Expression):
+    __slots__ = ()
     arg_types = {"this": True, "expression": False}
 
 
 class Semicolon(Expression):
+    __slots__ = ()
     arg_types = {}
 
 
 class TableColumn(Expression):
-    pass
+    __slots__ = ()
 
 
 class Variadic(Expression):
-    pass
+    __slots__ = ()
 
 
 class StoredProcedure(Expression):
+    __slots__ = ()
     arg_types = {"this": True, "expressions": False, "wrapped": False}
 
 
 class Block(Expression):
+    __slots__ = ()
     arg_types = {"expressions": True}
 
 
 class IfBlock(Expression):
+    __slots__ = ()
     arg_types = {"this": True, "true": True, "false": False}
 
 
 class WhileBlock(Expression):
+    __slots__ = ()
     arg_types = {"this": True, "body": True}
 
 
 class EndStatement(Expression):
+    __slots__ = ()
     arg_types = {}
 
 
@@ -9,69 +9,80 @@ from sqlglot.expressions.core import Expression, Func, Binary
 
 
 class Ascii(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class BitLength(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class ByteLength(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class Chr(Expression, Func):
+    __slots__ = ()
     arg_types = {"expressions": True, "charset": False}
     is_var_len_args = True
     _sql_names = ["CHR", "CHAR"]
 
 
 class Concat(Expression, Func):
+    __slots__ = ()
     arg_types = {"expressions": True, "safe": False, "coalesce": False}
     is_var_len_args = True
 
 
 class ConcatWs(Concat):
+    __slots__ = ()
     _sql_names = ["CONCAT_WS"]
 
 
 class Contains(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True, "json_scope": False}
 
 
 class Elt(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expressions": True}
     is_var_len_args = True
 
 
 class EndsWith(Expression, Func):
+    __slots__ = ()
     _sql_names = ["ENDS_WITH", "ENDSWITH"]
     arg_types = {"this": True, "expression": True}
 
 
 class Format(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expressions": False}
     is_var_len_args = True
 
 
 class Initcap(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": False}
 
 
 class IsAscii(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class Left(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True, "negative_length_returns_empty": False}
 
 
 class Length(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "binary": False, "encoding": False}
     _sql_names = ["LENGTH", "LEN", "CHAR_LENGTH", "CHARACTER_LENGTH"]
 
 
 class Levenshtein(Expression, Func):
+    __slots__ = ()
     arg_types = {
         "this": True,
         "expression": False,
@@ -83,50 +94,60 @@ class Levenshtein(Expression, Func):
 
 
 class Lower(Expression, Func):
+    __slots__ = ()
     _sql_names = ["LOWER", "LCASE"]
 
 
 class MatchAgainst(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expressions": True, "modifier": False}
 
 
 class Normalize(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "form": False, "is_casefold": False}
 
 
 class NumberToStr(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "format": True, "culture": False}
 
 
 class Overlay(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True, "from_": True, "for_": False}
 
 
 class Pad(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True, "fill_pattern": False, "is_left": True}
 
 
 class Repeat(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "times": True}
 
 
 class Replace(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True, "replacement": False}
 
 
 class Reverse(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class Right(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True, "negative_length_returns_empty": False}
 
 
 class RtrimmedLength(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class Search(Expression, Func):
+    __slots__ = ()
     arg_types = {
         "this": True,  # data_to_search / search_data
         "expression": True,  # search_query / search_string
@@ -138,15 +159,16 @@ class Search(Expression, Func):
 
 
 class SearchIp(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True}
 
 
 class Soundex(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class SoundexP123(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class Space(Expression, Func):
@@ -154,10 +176,13 @@ class Space(Expression, Func):
     SPACE(n) → string consisting of n blank characters
     """
 
+    __slots__ = ()
+
     pass
 
 
 class Split(Expression, Func):
+    __slots__ = ()
     arg_types = {
         "this": True,
         "expression": True,
@@ -168,6 +193,7 @@ class Split(Expression, Func):
 
 
 class SplitPart(Expression, Func):
+    __slots__ = ()
     arg_types = {
         "this": True,
         "delimiter": False,
@@ -178,6 +204,7 @@ class SplitPart(Expression, Func):
 
 
 class Strtok(Expression, Func):
+    __slots__ = ()
     arg_types = {
         "this": True,
         "delimiter": False,
@@ -186,11 +213,13 @@ class Strtok(Expression, Func):
 
 
 class StartsWith(Expression, Func):
+    __slots__ = ()
     _sql_names = ["STARTS_WITH", "STARTSWITH"]
     arg_types = {"this": True, "expression": True}
 
 
 class StrPosition(Expression, Func):
+    __slots__ = ()
     arg_types = {
         "this": True,
         "substr": True,
@@ -201,6 +230,7 @@ class StrPosition(Expression, Func):
 
 
 class StrToMap(Expression, Func):
+    __slots__ = ()
     arg_types = {
         "this": True,
         "pair_delim": False,
@@ -210,15 +240,18 @@ class StrToMap(Expression, Func):
 
 
 class String(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "zone": False}
 
 
 class Stuff(Expression, Func):
+    __slots__ = ()
     _sql_names = ["STUFF", "INSERT"]
     arg_types = {"this": True, "start": True, "length": True, "expression": True}
 
 
 class Substring(Expression, Func):
+    __slots__ = ()
     _sql_names = ["SUBSTRING", "SUBSTR"]
     arg_types = {"this": True, "start": False, "length": False, "zero_start": False}
 
@@ -231,14 +264,18 @@ class SubstringIndex(Expression, Func):
     *count* < 0  → right slice after the |count|-th delimiter
     """
 
+    __slots__ = ()
+
     arg_types = {"this": True, "delimiter": True, "count": True}
 
 
 class Translate(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "from_": True, "to": True}
 
 
 class Trim(Expression, Func):
+    __slots__ = ()
     arg_types = {
         "this": True,
         "expression": False,
@@ -248,10 +285,12 @@ class Trim(Expression, Func):
 
 
 class Unicode(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "empty_is_zero": False}
 
 
 class Upper(Expression, Func):
+    __slots__ = ()
     _sql_names = ["UPPER", "UCASE"]
 
 
@@ -259,82 +298,92 @@ class Upper(Expression, Func):
 
 
 class Base64DecodeBinary(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "alphabet": False}
 
 
 class Base64DecodeString(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "alphabet": False}
 
 
 class Base64Encode(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "max_line_length": False, "alphabet": False}
 
 
 class CodePointsToBytes(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class CodePointsToString(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class ConvertToCharset(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "dest": True, "source": False}
 
 
 class Decode(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "charset": True, "replace": False}
 
 
 class Encode(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "charset": True}
 
 
 class FromBase(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True}
 
 
 class FromBase32(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class FromBase64(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class Hex(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class HexDecodeString(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class HexEncode(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "case": False}
 
 
 class LowerHex(Hex):
-    pass
+    __slots__ = ()
 
 
 class SafeConvertBytesToString(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class ToBase32(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class ToBase64(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class ToBinary(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "format": False, "safe": False}
 
 
 class ToChar(Expression, Func):
+    __slots__ = ()
     arg_types = {
         "this": True,
         "format": False,
@@ -344,10 +393,11 @@ class ToChar(Expression, Func):
 
 
 class ToCodePoints(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class ToDecfloat(Expression, Func):
+    __slots__ = ()
     arg_types = {
         "this": True,
         "format": False,
@@ -355,6 +405,7 @@ class ToDecfloat(Expression, Func):
 
 
 class ToDouble(Expression, Func):
+    __slots__ = ()
     arg_types = {
         "this": True,
         "format": False,
@@ -363,6 +414,7 @@ class ToDouble(Expression, Func):
 
 
 class ToFile(Expression, Func):
+    __slots__ = ()
     arg_types = {
         "this": True,
         "path": False,
@@ -371,6 +423,7 @@ class ToFile(Expression, Func):
 
 
 class ToNumber(Expression, Func):
+    __slots__ = ()
     arg_types = {
         "this": True,
         "format": False,
@@ -383,22 +436,25 @@ class ToNumber(Expression, Func):
 
 
 class TryBase64DecodeBinary(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "alphabet": False}
 
 
 class TryBase64DecodeString(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "alphabet": False}
 
 
 class TryHexDecodeBinary(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class TryHexDecodeString(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class TryToDecfloat(Expression, Func):
+    __slots__ = ()
     arg_types = {
         "this": True,
         "format": False,
@@ -406,6 +462,7 @@ class TryToDecfloat(Expression, Func):
 
 
 class Unhex(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": False}
 
 
@@ -413,6 +470,7 @@ class Unhex(Expression, Func):
 
 
 class RegexpCount(Expression, Func):
+    __slots__ = ()
     arg_types = {
         "this": True,
         "expression": True,
@@ -422,6 +480,7 @@ class RegexpCount(Expression, Func):
 
 
 class RegexpExtract(Expression, Func):
+    __slots__ = ()
     arg_types = {
         "this": True,
         "expression": True,
@@ -434,6 +493,7 @@ class RegexpExtract(Expression, Func):
 
 
 class RegexpExtractAll(Expression, Func):
+    __slots__ = ()
     arg_types = {
         "this": True,
         "expression": True,
@@ -445,14 +505,17 @@ class RegexpExtractAll(Expression, Func):
 
 
 class RegexpFullMatch(Expression, Binary, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True, "options": False}
 
 
 class RegexpILike(Expression, Binary, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True, "flag": False}
 
 
 class RegexpInstr(Expression, Func):
+    __slots__ = ()
     arg_types = {
         "this": True,
         "expression": True,
@@ -465,6 +528,7 @@ class RegexpInstr(Expression, Func):
 
 
 class RegexpReplace(Expression, Func):
+    __slots__ = ()
     arg_types = {
         "this": True,
         "expression": True,
@@ -477,6 +541,7 @@ class RegexpReplace(Expression, Func):
 
 
 class RegexpSplit(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True, "limit": False}
 
 
@@ -484,10 +549,12 @@ class RegexpSplit(Expression, Func):
 
 
 class Compress(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "method": False}
 
 
 class Decrypt(Expression, Func):
+    __slots__ = ()
     arg_types = {
         "this": True,
         "passphrase": True,
@@ -498,6 +565,7 @@ class Decrypt(Expression, Func):
 
 
 class DecryptRaw(Expression, Func):
+    __slots__ = ()
     arg_types = {
         "this": True,
         "key": True,
@@ -510,68 +578,80 @@ class DecryptRaw(Expression, Func):
 
 
 class DecompressBinary(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "method": True}
 
 
 class DecompressString(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "method": True}
 
 
 class Encrypt(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "passphrase": True, "aad": False, "encryption_method": False}
 
 
 class EncryptRaw(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "key": True, "iv": True, "aad": False, "encryption_method": False}
 
 
 class CityHash64(Expression, Func):
+    __slots__ = ()
     arg_types = {"expressions": False}
     is_var_len_args = True
 
 
 class FarmFingerprint(Expression, Func):
+    __slots__ = ()
     arg_types = {"expressions": True}
     is_var_len_args = True
     _sql_names = ["FARM_FINGERPRINT", "FARMFINGERPRINT64"]
 
 
 class MD5(Expression, Func):
+    __slots__ = ()
     _sql_names = ["MD5"]
 
 
 class MD5Digest(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expressions": False}
     is_var_len_args = True
     _sql_names = ["MD5_DIGEST"]
 
 
 class MD5NumberLower64(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class MD5NumberUpper64(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class SHA(Expression, Func):
+    __slots__ = ()
     _sql_names = ["SHA", "SHA1"]
 
 
 class SHA1Digest(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class SHA2(Expression, Func):
+    __slots__ = ()
     _sql_names = ["SHA2"]
     arg_types = {"this": True, "length": False}
 
 
 class SHA2Digest(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "length": False}
 
 
 class StandardHash(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": False}
 
 
@@ -579,12 +659,13 @@ class StandardHash(Expression, Func):
 
 
 class ParseBignumeric(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class ParseNumeric(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class ParseUrl(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "part_to_extract": False, "key": False, "permissive": False}
@@ -23,50 +23,62 @@ if t.TYPE_CHECKING:
 
 
 class CurrentDate(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": False}
 
 
 class CurrentDatetime(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": False}
 
 
 class CurrentTime(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": False}
 
 
 class CurrentTimestamp(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": False, "sysdate": False}
 
 
 class CurrentTimestampLTZ(Expression, Func):
+    __slots__ = ()
     arg_types = {}
 
 
 class CurrentTimezone(Expression, Func):
+    __slots__ = ()
     arg_types = {}
 
 
 class Localtime(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": False}
 
 
 class Localtimestamp(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": False}
 
 
 class Systimestamp(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": False}
 
 
 class UtcDate(Expression, Func):
+    __slots__ = ()
     arg_types = {}
 
 
 class UtcTime(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": False}
 
 
 class UtcTimestamp(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": False}
 
 
@@ -74,18 +86,22 @@ class UtcTimestamp(Expression, Func):
 
 
 class AddMonths(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True, "preserve_end_of_month": False}
 
 
 class DateAdd(Expression, Func, IntervalOp):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True, "unit": False}
 
 
 class DateBin(Expression, Func, IntervalOp):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True, "unit": False, "zone": False, "origin": False}
 
 
 class DateDiff(Expression, Func, TimeUnit):
+    __slots__ = ()
     _sql_names = ["DATEDIFF", "DATE_DIFF"]
     arg_types = {
         "this": True,
@@ -98,51 +114,63 @@ class DateDiff(Expression, Func, TimeUnit):
 
 
 class DateSub(Expression, Func, IntervalOp):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True, "unit": False}
 
 
 class DatetimeAdd(Expression, Func, IntervalOp):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True, "unit": False}
 
 
 class DatetimeDiff(Expression, Func, TimeUnit):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True, "unit": False}
 
 
 class DatetimeSub(Expression, Func, IntervalOp):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True, "unit": False}
 
 
 class MonthsBetween(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True, "roundoff": False}
 
 
 class TimeAdd(Expression, Func, TimeUnit):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True, "unit": False}
 
 
 class TimeDiff(Expression, Func, TimeUnit):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True, "unit": False}
 
 
 class TimeSub(Expression, Func, TimeUnit):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True, "unit": False}
 
 
 class TimestampAdd(Expression, Func, TimeUnit):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True, "unit": False}
 
 
 class TimestampDiff(Expression, Func, TimeUnit):
+    __slots__ = ()
     _sql_names = ["TIMESTAMPDIFF", "TIMESTAMP_DIFF"]
     arg_types = {"this": True, "expression": True, "unit": False}
 
 
 class TimestampSub(Expression, Func, TimeUnit):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True, "unit": False}
 
 
 class TsOrDsAdd(Expression, Func, TimeUnit):
+    __slots__ = ()
     # return_type is used to correctly cast the arguments of this expression when transpiling it
     arg_types = {"this": True, "expression": True, "unit": False, "return_type": False}
 
@@ -152,6 +180,7 @@ class TsOrDsAdd(Expression, Func, TimeUnit):
 
 
 class TsOrDsDiff(Expression, Func, TimeUnit):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True, "unit": False}
 
 
@@ -159,10 +188,12 @@ class TsOrDsDiff(Expression, Func, TimeUnit):
 
 
 class DatetimeTrunc(Expression, Func, TimeUnit):
+    __slots__ = ()
     arg_types = {"this": True, "unit": True, "zone": False}
 
 
 class DateTrunc(Expression, Func):
+    __slots__ = ()
     arg_types = {"unit": True, "this": True, "zone": False, "input_type_preserved": False}
 
     def __init__(self, **args):
@@ -188,14 +219,17 @@ class DateTrunc(Expression, Func):
 
 
 class TimestampTrunc(Expression, Func, TimeUnit):
+    __slots__ = ()
     arg_types = {"this": True, "unit": True, "zone": False, "input_type_preserved": False}
 
 
 class TimeSlice(Expression, Func, TimeUnit):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True, "unit": True, "kind": False}
 
 
 class TimeTrunc(Expression, Func, TimeUnit):
+    __slots__ = ()
     arg_types = {"this": True, "unit": True, "zone": False}
 
 
@@ -203,82 +237,94 @@ class TimeTrunc(Expression, Func, TimeUnit):
 
 
 class Day(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class DayOfMonth(Expression, Func):
+    __slots__ = ()
     _sql_names = ["DAY_OF_MONTH", "DAYOFMONTH"]
 
 
 class DayOfWeek(Expression, Func):
+    __slots__ = ()
     _sql_names = ["DAY_OF_WEEK", "DAYOFWEEK"]
 
 
 class DayOfWeekIso(Expression, Func):
+    __slots__ = ()
     _sql_names = ["DAYOFWEEK_ISO", "ISODOW"]
 
 
 class DayOfYear(Expression, Func):
+    __slots__ = ()
     _sql_names = ["DAY_OF_YEAR", "DAYOFYEAR"]
 
 
 class Dayname(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "abbreviated": False}
 
 
 class Extract(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True}
 
 
 class GetExtract(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True}
 
 
 class Hour(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class Minute(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class Month(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class Monthname(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "abbreviated": False}
 
 
 class Quarter(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class Second(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class ToDays(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class Week(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "mode": False}
 
 
 class WeekOfYear(Expression, Func):
+    __slots__ = ()
     _sql_names = ["WEEK_OF_YEAR", "WEEKOFYEAR"]
 
 
 class Year(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class YearOfWeek(Expression, Func):
+    __slots__ = ()
     _sql_names = ["YEAR_OF_WEEK", "YEAROFWEEK"]
 
 
 class YearOfWeekIso(Expression, Func):
+    __slots__ = ()
     _sql_names = ["YEAR_OF_WEEK_ISO", "YEAROFWEEKISO"]
 
 
@@ -286,24 +332,28 @@ class YearOfWeekIso(Expression, Func):
 
 
 class Date(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": False, "zone": False, "expressions": False}
     is_var_len_args = True
 
 
 class DateFromParts(Expression, Func):
+    __slots__ = ()
     _sql_names = ["DATE_FROM_PARTS", "DATEFROMPARTS"]
     arg_types = {"year": True, "month": False, "day": False, "allow_overflow": False}
 
 
 class DateFromUnixDate(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class Datetime(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": False}
 
 
 class GapFill(Expression, Func):
+    __slots__ = ()
     arg_types = {
         "this": True,
         "ts_column": True,
@@ -316,31 +366,35 @@ class GapFill(Expression, Func):
 
 
 class GenerateDateArray(Expression, Func):
+    __slots__ = ()
     arg_types = {"start": True, "end": True, "step": False}
 
 
 class GenerateTimestampArray(Expression, Func):
+    __slots__ = ()
     arg_types = {"start": True, "end": True, "step": True}
 
 
 class JustifyDays(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class JustifyHours(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class JustifyInterval(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class LastDay(Expression, Func, TimeUnit):
+    __slots__ = ()
     _sql_names = ["LAST_DAY", "LAST_DAY_OF_MONTH"]
     arg_types = {"this": True, "unit": False}
 
 
 class MakeInterval(Expression, Func):
+    __slots__ = ()
     arg_types = {
         "year": False,
         "month": False,
@@ -353,18 +407,22 @@ class MakeInterval(Expression, Func):
 
 
 class NextDay(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True}
 
 
 class PreviousDay(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "expression": True}
 
 
 class Time(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": False, "zone": False}
 
 
 class TimeFromParts(Expression, Func):
+    __slots__ = ()
     _sql_names = ["TIME_FROM_PARTS", "TIMEFROMPARTS"]
     arg_types = {
         "hour": True,
@@ -378,10 +436,12 @@ class TimeFromParts(Expression, Func):
 
 
 class Timestamp(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": False, "zone": False, "with_tz": False}
 
 
 class TimestampFromParts(Expression, Func):
+    __slots__ = ()
     _sql_names = ["TIMESTAMP_FROM_PARTS", "TIMESTAMPFROMPARTS"]
     arg_types = {
         **TIMESTAMP_PARTS,
@@ -393,11 +453,13 @@ class TimestampFromParts(Expression, Func):
 
 
 class TimestampLtzFromParts(Expression, Func):
+    __slots__ = ()
     _sql_names = ["TIMESTAMP_LTZ_FROM_PARTS", "TIMESTAMPLTZFROMPARTS"]
     arg_types = TIMESTAMP_PARTS.copy()
 
 
 class TimestampTzFromParts(Expression, Func):
+    __slots__ = ()
     _sql_names = ["TIMESTAMP_TZ_FROM_PARTS", "TIMESTAMPTZFROMPARTS"]
     arg_types = {
         **TIMESTAMP_PARTS,
@@ -409,6 +471,7 @@ class TimestampTzFromParts(Expression, Func):
 
 
 class ConvertTimezone(Expression, Func):
+    __slots__ = ()
     arg_types = {
         "source_tz": False,
         "target_tz": True,
@@ -418,114 +481,126 @@ class ConvertTimezone(Expression, Func):
 
 
 class DateStrToDate(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class DateToDateStr(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class DateToDi(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class DiToDate(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class FromISO8601Timestamp(Expression, Func):
+    __slots__ = ()
     _sql_names = ["FROM_ISO8601_TIMESTAMP"]
 
 
 class ParseDatetime(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "format": False, "zone": False}
 
 
 class ParseTime(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "format": True}
 
 
 class StrToDate(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "format": False, "safe": False}
 
 
 class StrToTime(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "format": True, "zone": False, "safe": False, "target_type": False}
 
 
 class StrToUnix(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": False, "format": False}
 
 
 class TimeStrToDate(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class TimeStrToTime(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "zone": False}
 
 
 class TimeStrToUnix(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class TimeToStr(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "format": True, "culture": False, "zone": False}
 
 
 class TimeToTimeStr(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class TimeToUnix(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class TsOrDiToDi(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class TsOrDsToDate(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "format": False, "safe": False}
 
 
 class TsOrDsToDateStr(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class TsOrDsToDatetime(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class TsOrDsToTime(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "format": False, "safe": False}
 
 
 class TsOrDsToTimestamp(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class UnixDate(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class UnixMicros(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class UnixMillis(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class UnixSeconds(Expression, Func):
-    pass
+    __slots__ = ()
 
 
 class UnixToStr(Expression, Func):
+    __slots__ = ()
     arg_types = {"this": True, "format": False}
 
 
 class UnixToTime(Expression, Func):
+    __slots__ = ()
     arg_types = {
         "this": True,
         "scale": False,
@@ -549,4 +624,4 @@ class UnixToTime(Expression, Func):
 
 
 class UnixToTimeStr(Expression, Func):
-    pass
+    __slots__ = ()
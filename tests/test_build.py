@@ -59,6 +59,7 @@ class TestBuild(unittest.TestCase):
             (lambda: x.as_("y"), "x AS y"),
             (lambda: x.isin(1, "2"), "x IN (1, '2')"),
             (lambda: x.isin(query="select 1"), "x IN (SELECT 1)"),
+            (lambda: x.isin(query="(select 1)"), "x IN (SELECT 1)"),
             (lambda: x.isin(unnest="x"), "x IN (SELECT UNNEST(x))"),
             (lambda: x.isin(unnest="x"), "x IN UNNEST(x)", "bigquery"),
             (lambda: x.isin(unnest=["x", "y"]), "x IN (SELECT UNNEST(x, y))"),
@@ -2,8 +2,14 @@ import datetime
 import math
 import sys
 import unittest
+import weakref
+from unittest import mock
 
-from sqlglot import ParseError, alias, exp, parse_one
+import sqlglot.expressions.core as _core_module
+from sqlglot import ErrorLevel, ParseError, alias, exp, parse_one
+from sqlglot.dialects import Dialect
+
+_EXPRESSION_IS_COMPILED = getattr(_core_module, "__file__", "").endswith(".so")
 
 
 class TestExprs(unittest.TestCase):
@@ -83,6 +89,41 @@ class TestExprs(unittest.TestCase):
         expr == expr
         self.assertIsNone(expr._hash)
 
+    def test_struct_hash(self):
+        self.assertEqual(
+            parse_one("SELECT a FROM t WHERE x = 1").struct_hash(),
+            parse_one("SELECT b FROM u WHERE y = 'z'").struct_hash(),
+        )
+        self.assertEqual(
+            parse_one("a = b AND c").struct_hash(), parse_one("c AND b = a").struct_hash()
+        )
+        self.assertNotEqual(parse_one("a - b").struct_hash(), parse_one("a + b").struct_hash())
+        self.assertNotEqual(parse_one("a AND b").struct_hash(), parse_one("a OR b").struct_hash())
+        self.assertNotEqual(
+            parse_one("SELECT a").struct_hash(), parse_one("SELECT a, b").struct_hash()
+        )
+        for left, right in (
+            (
+                "SELECT * FROM a LEFT JOIN b ON a.x = b.x",
+                "SELECT * FROM a RIGHT JOIN b ON a.x = b.x",
+            ),
+            ("SELECT a FROM t ORDER BY a DESC", "SELECT a FROM t ORDER BY a"),
+            ("CAST(a AS INT)", "CAST(a AS TEXT)"),
+        ):
+            with self.subTest(left):
+                self.assertNotEqual(parse_one(left).struct_hash(), parse_one(right).struct_hash())
+
+        self.assertEqual(
+            parse_one("a IS DISTINCT FROM b").struct_hash(),
+            parse_one("b IS DISTINCT FROM a").struct_hash(),
+        )
+
+        expression = parse_one("SELECT a FROM t ORDER BY a")
+        struct_hash = expression.struct_hash()
+        self.assertEqual(expression.struct_hash(), struct_hash)
+        expression.find(exp.Ordered).set("desc", True)
+        self.assertNotEqual(expression.struct_hash(), struct_hash)
+
     def test_find(self):
         expression = parse_one("CREATE TABLE x STORED AS PARQUET AS SELECT * FROM y")
         self.assertTrue(expression.find(exp.Create))
@@ -373,6 +414,54 @@ class TestExprs(unittest.TestCase):
             "SELECT * FROM foo WHERE x > 0 AND y IS FALSE",
         )
 
+    def test_maybe_parse_returns_fresh_trees(self):
+        first = exp.maybe_parse("x = 1")
+        second = exp.maybe_parse("x = 1")
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+
+        first.this.replace(exp.column("y"))
+        self.assertEqual(second.sql(), "x = 1")
+        self.assertEqual(exp.maybe_parse("x = 1").sql(), "x = 1")
+        self.assertIsInstance(exp.maybe_parse("x", into=exp.Table), exp.Table)
+        self.assertIsInstance(exp.maybe_parse("x", into=exp.Column), exp.Column)
+
+        _core_module._parse_sql_cached.cache_clear()
+        self.addCleanup(_core_module._parse_sql_cached.cache_clear)
+        with mock.patch("sqlglot.parse_one", return_value=exp.column("patched")) as parse_one:
+            self.assertEqual(exp.maybe_parse("x").sql(), "patched")
+        parse_one.assert_called_once()
+
+    def test_child_list_builder_leaves_replaced_child_intact(self):
+        select = parse_one("SELECT a FROM t GROUP BY a")
+        group = select.args["group"]
+        select.group_by("b", copy=False)
+
+        self.assertEqual(group.sql(), "GROUP BY a")
+        self.assertIsNot(group.expressions, select.args["group"].expressions)
+        self.assertEqual(select.sql(), "SELECT a FROM t GROUP BY a, b")
+
+    def test_maybe_parse_cache(self):
+        cache = _core_module._parse_sql_cached
+        cache.cache_clear()
+        self.addCleanup(cache.cache_clear)
+
+        first = exp.maybe_parse("a + 1", dialect="duckdb")
+        second = exp.maybe_parse("a + 1", dialect="duckdb")
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+        self.assertEqual(cache.cache_info().hits, 1)
+
+        info = cache.cache_info()
+        exp.maybe_parse("a + 1", dialect="duckdb", error_level=ErrorLevel.IGNORE)
+        exp.maybe_parse("a + 1", dialect=Dialect.get_or_raise("duckdb"))
+        self.assertEqual(cache.cache_info(), info)
+
+        for _ in range(2):
+            with self.assertLogs("sqlglot", level="WARNING") as logs:
+                self.assertIsInstance(exp.maybe_parse("SHOW TABLES"), exp.Command)
+            self.assertIn("unsupported syntax", logs.output[0])
+
     def test_function_building(self):
         self.assertEqual(exp.func("max", 1).sql(), "MAX(1)")
         self.assertEqual(exp.func("max", 1, 2).sql(), "MAX(1, 2)")
@@ -529,6 +618,16 @@ class TestExprs(unittest.TestCase):
             },
         )
 
+        query = parse_one("SELECT a, b + 1 FROM x WHERE c IN (1, 2)")
+        query_hash = hash(query)
+        copy = query.copy()
+        self.assertEqual(copy._hash, query_hash)
+        self.assertTrue(all(node._hash is not None for node in copy.walk()))
+
+        copy.find(exp.Where).this.set("this", exp.column("d"))
+        self.assertIsNone(copy._hash)
+        self.assertNotEqual(hash(copy), query_hash)
+
     def test_sql(self):
         self.assertEqual(parse_one("x + y * 2").sql(), "x + y * 2")
         self.assertEqual(parse_one('select "x"').sql(dialect="hive", pretty=True), "SELECT\n  `x`")
@@ -598,6 +697,17 @@ class TestExprs(unittest.TestCase):
 
         self.assertEqual(expression.transform(fun).sql(), "SELECT a, b FROM x")
 
+    def test_transform_list_children_positions(self):
+        expression = parse_one("SELECT a, b, c FROM x").transform(
+            lambda n: exp.column(n.name.upper()) if isinstance(n, exp.Column) else n
+        )
+
+        self.assertEqual(expression.sql(), "SELECT A, B, C FROM x")
+        for i, projection in enumerate(expression.expressions):
+            self.assertIs(projection.parent, expression)
+            self.assertEqual(projection.arg_key, "expressions")
+            self.assertEqual(projection.index, i)
+
     def test_transform_node_removal(self):
         expression = parse_one("SELECT a, b FROM x")
 
@@ -650,6 +760,13 @@ class TestExprs(unittest.TestCase):
         expression.pop()
         self.assertEqual(expression.sql(), "SELECT FROM x")
 
+        expression = parse_one("SELECT a, b, c FROM x")
+        popped = expression.expressions[0].pop()
+        self.assertIsNone(popped.parent)
+        self.assertEqual([e.index for e in expression.expressions], [0, 1])
+        expression.expressions[1].pop()
+        self.assertEqual(expression.sql(), "SELECT b FROM x")
+
         expression = parse_one("WITH x AS (SELECT a FROM x) SELECT * FROM x")
         expression.find(exp.With).pop()
         self.assertEqual(expression.sql(), "SELECT * FROM x")
@@ -943,6 +1060,30 @@ class TestExprs(unittest.TestCase):
             "MAP_FROM_ARRAYS(ARRAY('test'), ARRAY('value'))",
         )
 
+    @unittest.skipIf(_EXPRESSION_IS_COMPILED, "mypyc compiled expressions don't support weakrefs")
+    def test_weakref(self):
+        for node in (exp.column("a"), exp.Literal.number(1), exp.select("x")):
+            with self.subTest(node):
+                self.assertIs(weakref.ref(node)(), node)
+
+    def test_binop_copies_container_operands(self):
+        select = parse_one("SELECT a")
+        a = select.expressions[0]
+        plus = exp.column("x") + [a, 1]
+        self.assertIs(select.expressions[0], a)
+        self.assertIs(a.parent, select)
+        self.assertEqual(select.sql(), "SELECT a")
+        self.assertEqual(plus.sql(), "x + ARRAY(a, 1)")
+
+        b = exp.column("b")
+        first = exp.column("x").eq((b, 2))
+        second = exp.column("y").eq((b, 3))
+        self.assertIs(first.expression.parent, first)
+        self.assertIs(second.expression.parent, second)
+        self.assertIsNone(b.parent)
+        self.assertEqual(first.sql(), "x = (b, 2)")
+        self.assertEqual(second.sql(), "y = (b, 3)")
+
     @unittest.skipUnless(sys.version_info >= (3, 9), "zoneinfo only available from python 3.9+")
     def test_convert_python39(self):
         import zoneinfo
@@ -1139,6 +1280,22 @@ FROM foo""",
         with self.assertRaises(ParseError):
             exp.DataType.build("varchar(")
 
+        first = exp.DataType.build("DECIMAL(10, 2)")
+        first.set("nested", True)
+        second = exp.DataType.build("DECIMAL(10, 2)")
+        self.assertIsNot(first, second)
+        self.assertFalse(second.args.get("nested"))
+        self.assertEqual(
+            exp.DataType.build("DECIMAL(10, 2)", nullable=True).sql(), "DECIMAL(10, 2)"
+        )
+        self.assertEqual(exp.DataType.build("TIMESTAMP").sql(), "TIMESTAMP")
+
+        int_type = exp.DataType.build("INT")
+        int_type.set("this", exp.DataType.Type.TEXT)
+        self.assertFalse(int_type.is_type("int"))
+        self.assertTrue(exp.DataType.build("INT").is_type("int"))
+        self.assertTrue(exp.DataType.build("TEXT").is_type("int", "text"))
+
     def test_rename_table(self):
         self.assertEqual(
             exp.rename_table("t1", "t2").sql(),